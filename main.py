@@ -5,15 +5,58 @@ DJZ-Speak v0: Command-line TTS tool with robotic voice synthesis
 
 import sys
 import argparse
+import codecs
+import collections
+import concurrent.futures
+import hashlib
 import os
+import queue
+import re
+import shutil
+import threading
+import time
 from pathlib import Path
-from typing import Optional
+from types import SimpleNamespace
+from typing import Callable, Optional, Tuple, TYPE_CHECKING
 
-# Import core modules
-from src.tts_engine import TTSEngine
-from src.config_manager import ConfigManager
-from src.voice_manager import VoiceManager
-from src.utils import setup_logging, validate_text_input, generate_timestamped_filename
+# Core modules pull in numpy/pydub/yaml, so they are imported lazily where
+# needed to keep `-h`, `--list-voices` and `--voice-info` fast.
+from src.utils import setup_logging, validate_text_input, generate_timestamped_filename, TimedBuffer
+
+if TYPE_CHECKING:
+    from src.tts_engine import TTSEngine
+    from src.voice_manager import VoiceManager
+
+# Hard cap on --stdin input so a runaway pipe cannot exhaust memory
+_MAX_STDIN_CHARS = 1_000_000
+
+# Path components that suggest the output is landing in a temp directory
+_TEMP_PATH_RE = re.compile(r'(?:^|[\\/])(?:te?mp|AppData[\\/]Local[\\/]Temp)(?:[\\/]|$)', re.IGNORECASE)
+
+# Defaults shared by the argparse parser and the plain-text fast path
+_ARG_DEFAULTS = {
+    'text': None,
+    'interactive': False,
+    'text_file': None,
+    'stdin': False,
+    'voice': 'classic_robot',
+    'speed': 140,
+    'pitch': 35,
+    'amplitude': 100,
+    'gap': 8,
+    'output': None,
+    'batch_output': None,
+    'play': True,
+    'format': 'wav',
+    'config': None,
+    'list_voices': False,
+    'voice_info': None,
+    'effects': False,
+    'daemon': False,
+    'serve_daemon': False,
+    'debug': False,
+    'quiet': False,
+}
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -39,25 +82,25 @@ Examples:
                        help='Read text from stdin')
     
     # Voice and synthesis options
-    parser.add_argument('--voice', default='classic_robot', 
+    parser.add_argument('--voice', default=_ARG_DEFAULTS['voice'], 
                        help='Voice preset (default: classic_robot)')
-    parser.add_argument('--speed', type=int, default=140, 
+    parser.add_argument('--speed', type=int, default=_ARG_DEFAULTS['speed'], 
                        help='Speech speed WPM (80-300, default: 140)')
-    parser.add_argument('--pitch', type=int, default=35, 
+    parser.add_argument('--pitch', type=int, default=_ARG_DEFAULTS['pitch'], 
                        help='Pitch level (0-99, default: 35)')
-    parser.add_argument('--amplitude', type=int, default=100, 
+    parser.add_argument('--amplitude', type=int, default=_ARG_DEFAULTS['amplitude'], 
                        help='Volume level (0-200, default: 100)')
-    parser.add_argument('--gap', type=int, default=8, 
+    parser.add_argument('--gap', type=int, default=_ARG_DEFAULTS['gap'], 
                        help='Word gap in 10ms units (default: 8)')
     
     # Output options
     parser.add_argument('--output', '-o', help='Output WAV file path')
     parser.add_argument('--batch-output', help='Directory for batch file output')
-    parser.add_argument('--play', action='store_true', default=True,
+    parser.add_argument('--play', action='store_true', default=_ARG_DEFAULTS['play'],
                        help='Play audio (default: enabled)')
     parser.add_argument('--no-play', dest='play', action='store_false',
                        help='Disable audio playback')
-    parser.add_argument('--format', choices=['wav', 'mp3'], default='wav',
+    parser.add_argument('--format', choices=['wav', 'mp3'], default=_ARG_DEFAULTS['format'],
                        help='Audio format (default: wav)')
     
     # Configuration options
@@ -69,6 +112,10 @@ Examples:
     # Advanced options
     parser.add_argument('--effects', action='store_true',
                        help='Apply robotic audio effects')
+    parser.add_argument('--daemon', action='store_true',
+                       help='Synthesize through a warm background daemon (also DJZSPEAK_DAEMON=1)')
+    parser.add_argument('--serve-daemon', action='store_true',
+                       help=argparse.SUPPRESS)
     parser.add_argument('--debug', action='store_true',
                        help='Enable debug output')
     parser.add_argument('--quiet', action='store_true',
@@ -77,15 +124,55 @@ Examples:
     return parser
 
 
-def interactive_mode(engine: TTSEngine, voice_manager: VoiceManager):
+def _synthesis_loop(engine: 'TTSEngine', pool: queue.Queue, player_queue: queue.Queue):
+    """Synthesize pooled text and hand the audio to the playback thread.
+    
+    Lines are streamed a sentence at a time, so a long line starts playing
+    as soon as its first sentence is ready.
+    """
+    while True:
+        text, voice_params = pool.get()
+        try:
+            engine.synthesize_streaming(text, sink=player_queue.put, voice_params=voice_params)
+        except Exception as e:
+            # Keep the thread alive so later lines and !wait still work
+            print(f"Synthesis error: {e}")
+        finally:
+            pool.task_done()
+
+
+def _playback_loop(engine: 'TTSEngine', player_queue: queue.Queue):
+    """Play synthesized audio in the order it was produced."""
+    while True:
+        audio_data = player_queue.get()
+        try:
+            engine.play_audio(audio_data)
+        except Exception as e:
+            print(f"Playback error: {e}")
+        finally:
+            player_queue.task_done()
+
+
+def interactive_mode(engine: 'TTSEngine', voice_manager: 'VoiceManager'):
     """Run interactive TTS session."""
     print("DJZ-Speak Interactive Mode")
-    print("Commands: !voice <preset>, !speed <wpm>, !pitch <level>, !quit")
+    print("Commands: !voice <preset>, !speed <wpm>, !pitch <level>, !wait, !quit")
     print("Enter text to synthesize, or type !quit to exit\n")
     
     current_voice = voice_manager.get_current_voice()
     print(f"Current voice: {current_voice['name']}")
     
+    # Two-stage pipeline: the prompt keeps accepting lines while earlier
+    # ones are synthesized and played in the background
+    pool = queue.Queue()
+    player_queue = queue.Queue()
+    threading.Thread(target=_synthesis_loop, args=(engine, pool, player_queue), daemon=True).start()
+    threading.Thread(target=_playback_loop, args=(engine, player_queue), daemon=True).start()
+    
+    def wait_for_pending():
+        pool.join()
+        player_queue.join()
+    
     try:
         while True:
             try:
@@ -96,19 +183,21 @@ def interactive_mode(engine: TTSEngine, voice_manager: VoiceManager):
                 
                 # Handle commands
                 if text.startswith('!'):
-                    handle_interactive_command(text, engine, voice_manager)
+                    handle_interactive_command(text, engine, voice_manager, wait_for_pending)
                     continue
                 
-                # Synthesize text
+                # Queue text for synthesis with the voice in effect now; commands
+                # only change the engine and voice manager on this thread
                 if validate_text_input(text):
-                    audio_data = engine.synthesize(text)
-                    engine.play_audio(audio_data)
+                    pool.put((text, dict(voice_manager.get_espeak_parameters())))
                 else:
                     print("Invalid text input")
                     
             except KeyboardInterrupt:
                 print("\nUse !quit to exit")
             except EOFError:
+                # Let scripted sessions finish speaking before exiting
+                wait_for_pending()
                 break
                 
     except Exception as e:
@@ -117,12 +206,16 @@ def interactive_mode(engine: TTSEngine, voice_manager: VoiceManager):
     print("\nGoodbye!")
 
 
-def handle_interactive_command(command: str, engine: TTSEngine, voice_manager: VoiceManager):
+def handle_interactive_command(command: str, engine: 'TTSEngine', voice_manager: 'VoiceManager',
+                               wait_for_pending: Optional[Callable[[], None]] = None):
     """Handle interactive commands."""
     parts = command[1:].split()
     cmd = parts[0].lower()
     
     if cmd == 'quit' or cmd == 'exit':
+        # Finish speaking what was already queued rather than dropping it
+        if wait_for_pending:
+            wait_for_pending()
         sys.exit(0)
     elif cmd == 'voice' and len(parts) > 1:
         voice_name = parts[1]
@@ -151,47 +244,342 @@ def handle_interactive_command(command: str, engine: TTSEngine, voice_manager: V
                 print("Pitch must be between 0-99")
         except ValueError:
             print("Invalid pitch value")
+    elif cmd == 'wait':
+        if wait_for_pending:
+            wait_for_pending()
     elif cmd == 'help':
         print("Commands:")
         print("  !voice <preset>  - Change voice preset")
         print("  !speed <wpm>     - Set speech speed (80-300)")
         print("  !pitch <level>   - Set pitch level (0-99)")
-        print("  !quit            - Exit interactive mode")
+        print("  !wait            - Wait for queued text to finish playing")
+        print("  !quit            - Exit once queued text has played")
     else:
         print(f"Unknown command: {cmd}")
 
 
-def process_batch_files(engine: TTSEngine, text_file: str, output_dir: str):
+def _cache_key(text: str, voice: str, speed: int, pitch: int, amplitude: int, gap: int) -> str:
+    """Build the synthesis cache key for a text and its voice parameters."""
+    payload = '\x00'.join(str(part) for part in (voice, speed, pitch, amplitude, gap, text))
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _cache_path(engine: 'TTSEngine', text: str, params: Optional[dict] = None) -> Path:
+    """Get the cache file for text rendered with params, or the engine's current voice."""
+    if params is None:
+        params = engine.voice_manager.get_espeak_parameters()
+    key = _cache_key(
+        text,
+        f"{params.get('voice', 'en')}+{params.get('variant', 'm3')}",
+        params.get('speed', 140),
+        params.get('pitch', 35),
+        params.get('amplitude', 100),
+        params.get('gap', 8),
+    )
+    return engine.config_manager.get_cache_directory() / f"{key}.wav"
+
+
+def _cache_load(cache_path: Path) -> Optional[bytes]:
+    """Read a cached WAV, or return None on a miss."""
+    try:
+        # Cached utterances are small; reading them holds no handle open, so
+        # the file can still be pruned or replaced (Windows refuses both while
+        # a mapping exists)
+        audio_data = cache_path.read_bytes()
+        os.utime(cache_path)  # Mark as recently used
+        return audio_data
+    except OSError:
+        return None
+
+
+def _cache_store(cache_path: Path, audio_data: bytes) -> None:
+    """Write freshly synthesized audio to the cache."""
+    # Write under a unique name first so concurrent workers never see partial files
+    tmp_path = cache_path.with_name(f"{cache_path.stem}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(audio_data)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def _synthesize_cached(engine: 'TTSEngine', text: str,
+                       validated: bool = False) -> Tuple[Optional[bytes], Optional[Path]]:
+    """Synthesize text, reusing a previously rendered WAV from the cache.
+    
+    Returns the audio data and, on a cache hit, the cache file it was read from.
+    """
+    cache_path = _cache_path(engine, text)
+    
+    audio_data = _cache_load(cache_path)
+    if audio_data is not None:
+        return audio_data, cache_path
+    
+    audio_data = engine.synthesize(text, validated=validated)
+    if audio_data:
+        _cache_store(cache_path, audio_data)
+    
+    return audio_data, None
+
+
+def _prune_cache(config_manager, force: bool = False) -> None:
+    """Evict least recently used cache entries beyond the configured size.
+    
+    The cache directory is scanned at most once per cache_prune_interval
+    seconds, tracked by a marker file, unless force is set.
+    """
+    max_bytes = config_manager.get('performance', 'cache_size', 50) * 1024 * 1024
+    interval = config_manager.get('performance', 'cache_prune_interval', 60)
+    cache_dir = config_manager.get_cache_directory()
+    marker = cache_dir / '.last_prune'
+    
+    try:
+        try:
+            if not force and time.time() - marker.stat().st_mtime < interval:
+                return
+        except FileNotFoundError:
+            pass
+        marker.touch()
+        
+        entries = []
+        total = 0
+        for entry in os.scandir(cache_dir):
+            if entry.name.endswith('.wav') and entry.is_file():
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+        
+        if total <= max_bytes:
+            return
+        
+        entries.sort()
+        for _, size, path in entries:
+            os.remove(path)
+            total -= size
+            if total <= max_bytes:
+                break
+    except OSError:
+        pass
+
+
+# Upper bound on batch lines handed to a worker process at once
+_BATCH_CHUNK_SIZE = 32
+
+
+def _synth_chunk(args: tuple) -> list:
+    """Synthesize a chunk of batch lines (runs in a worker process).
+    
+    Returns (text, audio bytes) pairs. The worker engine is shared with
+    TTSEngine.batch_synthesize; the voice parameters are resolved once in the
+    parent and passed with every chunk.
+    """
+    from src.tts_engine import get_worker_engine
+    
+    texts, voice_params, config_file = args
+    engine = get_worker_engine(config_file)
+    
+    results = []
+    for text in texts:
+        cache_path = _cache_path(engine, text, voice_params)
+        audio_data = _cache_load(cache_path)
+        if audio_data is None:
+            # Batch lines are validated before they are dispatched
+            audio_data = engine.synthesize(text, validated=True, voice_params=voice_params)
+            if audio_data:
+                _cache_store(cache_path, audio_data)
+        results.append((text, audio_data))
+    
+    return results
+
+
+def _save_one(engine, audio_data, path: str, format: str) -> bool:
+    """Save audio to path, returning True on success.
+    
+    engine may be a TTSEngine or an AudioProcessor; only save_audio is used.
+    With no engine, audio_data is WAV bytes and is written out as-is.
+    A Path is a cached WAV file that is copied to the destination as-is,
+    letting the OS use sendfile instead of a userspace read+write.
+    """
+    if isinstance(audio_data, Path):
+        try:
+            shutil.copyfile(audio_data, path)
+            return True
+        except OSError as e:
+            print(f"Error copying cached audio to {path}: {e}")
+            return False
+    if engine is None:
+        try:
+            Path(path).write_bytes(audio_data)
+            return True
+        except OSError as e:
+            print(f"Error writing audio to {path}: {e}")
+            return False
+    return engine.save_audio(audio_data, path, format)
+
+
+class _SaveResult:
+    """Mutable holder for the outcome of a save running on another thread."""
+    
+    __slots__ = ('success',)
+    
+    def __init__(self):
+        self.success = False
+
+
+def _save_wrapper(result: _SaveResult, engine, audio_data, path: str, format: str):
+    """Thread target that records the save outcome in result."""
+    result.success = _save_one(engine, audio_data, path, format)
+
+
+def _iter_lines(path: str, block_size: int = 1 << 20):
+    """Yield non-empty, stripped lines from a text file without loading it whole.
+    
+    The file is decoded and split a block at a time, so line splitting happens
+    in C rather than through per-line file iteration.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    tail = ''
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            lines = (tail + decoder.decode(block)).split('\n')
+            tail = lines.pop()
+            for line in lines:
+                line = line.strip()
+                if line:
+                    yield line
+        tail += decoder.decode(b'', final=True)
+    
+    tail = tail.strip()
+    if tail:
+        yield tail
+
+
+def _count_lines(path: str) -> int:
+    """Count the non-empty lines in a text file without decoding it."""
+    with open(path, 'rb') as f:
+        return sum(1 for line in f if line.strip())
+
+
+def process_batch_files(engine: 'TTSEngine', text_file: str, output_dir: str):
     """Process multiple texts from file."""
     try:
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
-        with open(text_file, 'r', encoding='utf-8') as f:
-            lines = [line.strip() for line in f.readlines() if line.strip()]
+        voice_params = dict(engine.voice_manager.get_espeak_parameters())
+        config_file = str(engine.config_manager.config_file)
+        max_workers = os.cpu_count() or 1
+        max_pending = max_workers * 2
+        window = collections.deque()  # (lines, future) chunks in file order
+        queued = []
+        
+        # One extra sequential (OS-cached) read for the progress denominator
+        total = _count_lines(text_file)
+        
+        # Lines go to workers in chunks so each task amortizes its voice setup,
+        # but small files are still spread across every core
+        chunk_size = max(1, min(_BATCH_CHUNK_SIZE, -(-total // max_workers)))
+        
+        # Finished WAVs are written in batches by a single flusher thread
+        config_manager = engine.config_manager
+        writer = TimedBuffer(
+            flush_bytes=config_manager.get('batch', 'flush_bytes', 4 * 1024 * 1024),
+            flush_interval=config_manager.get('batch', 'flush_interval_ms', 50) / 1000
+        )
+        
+        def collect_oldest():
+            lines, future = window.popleft()
+            audio_by_text = dict(future.result())
+            
+            for i, text in lines:
+                audio_data = audio_by_text.get(text)
+                if audio_data:
+                    print(f"Processed line {i}/{total}: {text[:50]}...")
+                    output_file = str(output_path / f"line_{i:03d}.wav")
+                    writer.write(output_file, audio_data)
+                    queued.append(output_file)
+                else:
+                    print(f"Failed to synthesize line {i}")
+        
+        def submit(lines):
+            # Duplicate lines within a chunk share one synthesis
+            texts = list(dict.fromkeys(text for _, text in lines))
+            window.append((lines, ex.submit(_synth_chunk, (texts, voice_params, config_file))))
+            if len(window) >= max_pending:
+                collect_oldest()
         
-        for i, text in enumerate(lines, 1):
-            if validate_text_input(text):
-                print(f"Processing line {i}/{len(lines)}: {text[:50]}...")
-                audio_data = engine.synthesize(text)
+        # Each line is an independent eSpeak call, so fan out across cores.
+        # Lines are streamed from disk and only a bounded window is in flight.
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as ex:
+            lines = []
+            for i, text in enumerate(_iter_lines(text_file), 1):
+                if not validate_text_input(text):
+                    print(f"Skipping invalid text on line {i}")
+                    continue
                 
-                output_file = output_path / f"line_{i:03d}.wav"
-                engine.save_audio(audio_data, str(output_file))
+                lines.append((i, text))
+                if len(lines) >= chunk_size:
+                    submit(lines)
+                    lines = []
+            
+            if lines:
+                submit(lines)
+            
+            while window:
+                collect_oldest()
+        
+        results = writer.close()
+        
+        processed = 0
+        for output_file in queued:
+            if results.get(output_file, False):
+                processed += 1
                 print(f"Saved: {output_file}")
             else:
-                print(f"Skipping invalid text on line {i}")
-                
-        print(f"Batch processing complete. {len(lines)} files processed.")
+                print(f"Error: Failed to save audio to {output_file}")
+        
+        # A batch can add many entries, so always check the size afterwards
+        _prune_cache(config_manager, force=True)
+        print(f"Batch processing complete. {processed} files processed.")
         
     except Exception as e:
         print(f"Batch processing error: {e}")
         sys.exit(1)
 
 
+def _create_engine(config_manager, voice_manager: 'VoiceManager', args) -> 'TTSEngine':
+    """Create the TTS engine and apply the command-line synthesis parameters."""
+    from src.tts_engine import TTSEngine
+    
+    engine = TTSEngine(config_manager, voice_manager)
+    engine.set_speed(args.speed)
+    engine.set_pitch(args.pitch)
+    engine.set_amplitude(args.amplitude)
+    engine.set_gap(args.gap)
+    return engine
+
+
+def parse_args(argv=None):
+    """Parse command-line arguments.
+    
+    A lone positional text argument (the common `main.py "text"` call) is
+    handled without building the argparse parser.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    if len(argv) == 1 and not argv[0].startswith('-'):
+        return SimpleNamespace(**dict(_ARG_DEFAULTS, text=argv[0]))
+    
+    return create_parser().parse_args(argv)
+
+
 def main():
     """Main application entry point."""
-    parser = create_parser()
-    args = parser.parse_args()
+    args = parse_args()
     
     # Setup logging
     log_level = 'DEBUG' if args.debug else 'INFO'
@@ -199,11 +587,18 @@ def main():
         log_level = 'ERROR'
     setup_logging(log_level)
     
+    if args.serve_daemon:
+        from src.daemon import serve
+        serve(args.config)
+        return
+    
     try:
-        # Initialize components
+        # Initialize components (voice listing does not need the engine)
+        from src.config_manager import ConfigManager
+        from src.voice_manager import VoiceManager
+        
         config_manager = ConfigManager(args.config)
         voice_manager = VoiceManager(config_manager)
-        engine = TTSEngine(config_manager, voice_manager)
         
         # Handle special commands
         if args.list_voices:
@@ -224,14 +619,16 @@ def main():
                 print(f"Voice preset '{args.voice_info}' not found")
             return
         
-        # Set voice and parameters
+        # Set voice
         if not voice_manager.set_voice(args.voice):
             print(f"Warning: Voice '{args.voice}' not found, using default")
         
-        engine.set_speed(args.speed)
-        engine.set_pitch(args.pitch)
-        engine.set_amplitude(args.amplitude)
-        engine.set_gap(args.gap)
+        # Single utterances can be served by the warm daemon without
+        # initializing a local engine at all
+        use_daemon = args.daemon or os.environ.get('DJZSPEAK_DAEMON') == '1'
+        engine = None
+        if not use_daemon or args.interactive or (args.text_file and args.batch_output):
+            engine = _create_engine(config_manager, voice_manager, args)
         
         # Determine input source
         text_input = None
@@ -249,7 +646,15 @@ def main():
                 with open(args.text_file, 'r', encoding='utf-8') as f:
                     text_input = f.read().strip()
         elif args.stdin:
-            text_input = sys.stdin.read().strip()
+            # Bytes in, one decode; never buffer more than the guard allows
+            raw = sys.stdin.buffer.read(_MAX_STDIN_CHARS * 4 + 1)
+            if len(raw) > _MAX_STDIN_CHARS * 4:
+                print("Error: stdin input is too large")
+                sys.exit(1)
+            text_input = raw.decode('utf-8', 'strict').strip()
+            if len(text_input) > _MAX_STDIN_CHARS:
+                print("Error: stdin input is too large")
+                sys.exit(1)
         else:
             print("Error: No text input provided. Use -h for help.")
             sys.exit(1)
@@ -259,64 +664,108 @@ def main():
             print("Error: Invalid text input")
             sys.exit(1)
         
-        print(f"Synthesizing: {text_input[:100]}{'...' if len(text_input) > 100 else ''}")
+        preview = text_input if len(text_input) <= 100 else text_input[:100] + '...'
+        print(f"Synthesizing: {preview}")
         
-        # Generate audio
-        audio_data = engine.synthesize(text_input)
+        audio_data = None
+        cache_hit = None
         
-        # Apply effects if requested
-        if args.effects:
-            audio_data = engine.apply_robotic_effects(audio_data)
+        if engine is None:
+            from src.daemon import request_synthesis
+            audio_data = request_synthesis(config_manager, {
+                'text': text_input,
+                'voice': voice_manager.current_voice,
+                'speed': args.speed,
+                'pitch': args.pitch,
+                'amplitude': args.amplitude,
+                'gap': args.gap,
+                'effects': args.effects,
+            }, args.config)
+            
+            if audio_data is None:
+                print("Warning: Synthesis daemon unavailable, synthesizing locally")
+                engine = _create_engine(config_manager, voice_manager, args)
         
-        # Handle output - always save to default directory if no output specified
-        output_path = args.output
-        if not output_path:
-            # Generate default output path
-            default_output_dir = config_manager.get_default_output_directory()
-            filename = generate_timestamped_filename(text_input, args.format)
-            output_path = default_output_dir / filename
+        if engine is not None:
+            # Generate audio (served from the on-disk cache when possible)
+            audio_data, cache_hit = _synthesize_cached(engine, text_input, validated=True)
+            if cache_hit is None:
+                # Only new entries grow the cache
+                _prune_cache(config_manager)
             
-            # Ensure the output directory exists and is writable
-            try:
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                if not args.quiet:
-                    print(f"Using default output directory: {output_path.parent}")
-            except PermissionError:
-                print(f"Error: Cannot create output directory {output_path.parent}")
-                print("Check permissions or specify a different output path with --output")
-                sys.exit(1)
+            # Apply effects if requested; the processed segment is saved and
+            # played directly rather than re-encoded to WAV bytes in between
+            if args.effects:
+                audio_data = engine.apply_robotic_effects(audio_data, as_bytes=False)
+            
+            output = engine
         else:
-            # User specified output path - ensure directory exists
-            output_path = Path(output_path)
-            try:
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-            except PermissionError:
-                print(f"Error: Cannot create directory {output_path.parent}")
+            # Daemon audio is a finished WAV; the audio processor is only
+            # needed to play it or convert it to another format
+            output = None
+            if args.play or args.format != 'wav':
+                from src.audio_processor import AudioProcessor
+                output = AudioProcessor(config_manager)
+        
+        # Handle output - always save to default directory if no output specified
+        if args.output:
+            out_path = Path(args.output)
+        else:
+            out_path = (config_manager.get_default_output_directory()
+                        / generate_timestamped_filename(text_input, args.format))
+        out_str = str(out_path)
+        out_dir = out_path.parent
+        
+        # Ensure the output directory exists and is writable
+        try:
+            out_dir.mkdir(parents=True, exist_ok=True)
+        except PermissionError:
+            if args.output:
+                print(f"Error: Cannot create directory {out_dir}")
                 print("Check permissions or choose a different output path")
-                sys.exit(1)
+            else:
+                print(f"Error: Cannot create output directory {out_dir}")
+                print("Check permissions or specify a different output path with --output")
+            sys.exit(1)
+        if not args.output and not args.quiet:
+            print(f"Using default output directory: {out_dir}")
         
         # Validate output path is not in temp directory
-        temp_indicators = ['temp', 'tmp', 'AppData\\Local\\Temp', 'AppData/Local/Temp']
-        output_str = str(output_path).lower()
-        if any(indicator in output_str for indicator in temp_indicators):
-            print(f"Warning: Output path appears to be in temp directory: {output_path}")
+        if _TEMP_PATH_RE.search(out_str):
+            print(f"Warning: Output path appears to be in temp directory: {out_str}")
             print("This might indicate a configuration issue.")
         
-        # Save audio file
-        success = engine.save_audio(audio_data, str(output_path), args.format)
+        # Copy a cache hit straight to the destination when nothing altered it
+        if cache_hit and not args.effects and args.format == 'wav':
+            save_source = cache_hit
+        else:
+            save_source = audio_data
+        
+        save_result = _SaveResult()
+        if args.play:
+            # Save in the background while playback runs from the same buffer
+            save_thread = threading.Thread(
+                target=_save_wrapper,
+                args=(save_result, output, save_source, out_str, args.format),
+                daemon=True
+            )
+            save_thread.start()
+            output.play_audio(audio_data)
+            save_thread.join()
+        else:
+            _save_wrapper(save_result, output, save_source, out_str, args.format)
+        
+        success = save_result.success
         if success:
             # Verify file was actually created at the expected location
-            if output_path.exists():
-                print(f"Audio saved to: {output_path.resolve()}")
+            if os.path.exists(out_str):
+                print(f"Audio saved to: {os.path.abspath(out_str)}")
             else:
-                print(f"Warning: Audio save reported success but file not found at: {output_path}")
+                print(f"Warning: Audio save reported success but file not found at: {out_str}")
         else:
-            print(f"Error: Failed to save audio to {output_path}")
+            print(f"Error: Failed to save audio to {out_str}")
             sys.exit(1)
         
-        if args.play:
-            engine.play_audio(audio_data)
-        
         print("Synthesis complete!")
         
     except KeyboardInterrupt:
@@ -0,0 +1,40 @@
+"""
+Compiled effect kernels for DJZ-Speak
+
+Importing this module imports numba, so audio_processor only loads it the
+first time an effect kernel actually runs.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(cache=True, parallel=True, fastmath=True)
+def mechanical_artifacts_kernel(samples, mask, gain, lo, hi):
+    """Mix a bit-crushed copy of the samples back in (compiled)."""
+    out = np.empty_like(samples)
+    for i in prange(samples.shape[0]):
+        s = np.int64(samples[i])
+        v = s + np.int64(np.floor((s & mask) * gain))
+        if v < lo:
+            v = lo
+        elif v > hi:
+            v = hi
+        out[i] = v
+    return out
+
+
+@njit(cache=True, parallel=True)
+def enhance_kernel(samples, factor):
+    """Soft-clip float64 (frames, channels) samples against each channel's peak (compiled)."""
+    n, channels = samples.shape
+    out = samples.copy()
+    for c in range(channels):
+        peak = 0.0
+        for i in range(n):
+            peak = max(peak, abs(samples[i, c]))
+        
+        if peak > 0:
+            for i in prange(n):
+                out[i, c] = np.tanh(samples[i, c] / peak * factor) * peak * 0.8
+    return out
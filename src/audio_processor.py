@@ -2,14 +2,19 @@
 Audio processing and effects for DJZ-Speak
 """
 
+import importlib.util
 import io
 import logging
+import math
 import numpy as np
 from pathlib import Path
 from typing import Optional, Dict, Any, Union
 import tempfile
 import os
 
+# Raw WAV data may arrive as bytes or as a zero-copy view (e.g. a memory-mapped file)
+_BYTES_LIKE = (bytes, bytearray, memoryview)
+
 try:
     import soundfile as sf
     SOUNDFILE_AVAILABLE = True
@@ -23,16 +28,95 @@ try:
 except ImportError:
     PYDUB_AVAILABLE = False
 
-try:
-    import scipy.signal
-    SCIPY_AVAILABLE = True
-except ImportError:
-    SCIPY_AVAILABLE = False
+# scipy.signal and numba take most of a second to import, far longer than
+# saving or playing a short clip; they are only located here and imported
+# by the effects that use them
+SCIPY_AVAILABLE = importlib.util.find_spec('scipy') is not None
+NUMBA_AVAILABLE = importlib.util.find_spec('numba') is not None
+
+
+# Level of the quantization artifacts mixed back into the signal (-20 dB)
+_ARTIFACT_GAIN = 0.1
+
+# NumPy dtypes for pydub's signed PCM sample widths
+_SAMPLE_DTYPES = {1: np.int8, 2: np.int16, 4: np.int32}
+
+# Masks that keep only the top byte of each sample, and clipping bounds, per width
+_ARTIFACT_MASKS = {width: ~((1 << (8 * (width - 1))) - 1) for width in _SAMPLE_DTYPES}
+_SAMPLE_LIMITS = {width: (int(np.iinfo(dtype).min), int(np.iinfo(dtype).max))
+                  for width, dtype in _SAMPLE_DTYPES.items()}
+
+# Minimum silence trim_silence removes, and the padding it keeps, in ms (pydub's defaults)
+_SILENCE_LEN_MS = 1000
+_SILENCE_PADDING_MS = 100
+
+# libsndfile WAV subtypes for the widths soundfile can write from integer arrays
+_SOUNDFILE_SUBTYPES = {2: 'PCM_16', 4: 'PCM_32'}
+
+
+def _mechanical_artifacts_numpy(samples, mask, gain, lo, hi):
+    """Mix a bit-crushed copy of the samples back in (vectorized)."""
+    s = samples.astype(np.int64)
+    mixed = s + np.floor((s & mask) * gain).astype(np.int64)
+    np.clip(mixed, lo, hi, out=mixed)
+    return mixed.astype(samples.dtype)
+
+
+def _enhance_numpy(samples, factor):
+    """Soft-clip float64 (frames, channels) samples against each channel's peak (vectorized)."""
+    buf = samples.copy()
+    if not buf.size:
+        return buf
+    peak = np.abs(buf).max(axis=0, keepdims=True)
+    peak[peak == 0] = 1  # Silent channels stay silent
+    np.divide(buf, peak, out=buf)
+    np.multiply(buf, factor, out=buf)
+    np.tanh(buf, out=buf)
+    np.multiply(buf, peak, out=buf)
+    np.multiply(buf, 0.8, out=buf)
+    return buf
+
+
+# (mechanical artifacts, harmonic enhancement) kernels, resolved on first use
+_effect_kernels = None
+
+
+def _kernels():
+    """Get the effect kernels, compiled with numba when it is installed."""
+    global _effect_kernels
+    
+    if _effect_kernels is None:
+        kernels = (_mechanical_artifacts_numpy, _enhance_numpy)
+        if NUMBA_AVAILABLE:
+            try:
+                from src import audio_kernels
+                kernels = (audio_kernels.mechanical_artifacts_kernel, audio_kernels.enhance_kernel)
+            except ImportError:
+                pass
+        _effect_kernels = kernels
+    
+    return _effect_kernels
+
+
+def _mechanical_artifacts_kernel(samples, mask, gain, lo, hi):
+    """Mix a bit-crushed copy of the samples back in."""
+    return _kernels()[0](samples, mask, gain, lo, hi)
+
+
+def _enhance_kernel(samples, factor):
+    """Soft-clip float64 (frames, channels) samples against each channel's peak."""
+    return _kernels()[1](samples, factor)
 
 
 class AudioProcessor:
     """Handles audio processing, effects, and output for DJZ-Speak."""
     
+    __slots__ = (
+        'logger', 'config_manager', 'audio_params', 'effects_params',
+        '_filter_enabled', '_low_cutoff', '_high_cutoff', '_harmonic_factor',
+        '_mechanical_artifacts', '_bandpass_sos',
+    )
+    
     def __init__(self, config_manager):
         """Initialize audio processor."""
         self.logger = logging.getLogger(__name__)
@@ -40,8 +124,31 @@ class AudioProcessor:
         self.audio_params = config_manager.get_audio_params()
         self.effects_params = config_manager.get_effects_params()
         
+        # Effect settings are fixed for the processor's lifetime, so resolve them once
+        filter_params = self.effects_params.get('frequency_filter', {})
+        self._filter_enabled = filter_params.get('enable', True)
+        self._low_cutoff = filter_params.get('low_cutoff', 300)
+        self._high_cutoff = filter_params.get('high_cutoff', 3000)
+        self._harmonic_factor = float(self.effects_params.get('harmonic_enhancement', 1.0))
+        self._mechanical_artifacts = self.effects_params.get('mechanical_artifacts', True)
+        
+        # Designed band-pass filters keyed by frame rate
+        self._bandpass_sos = {}
+        
         # Check dependencies
         self._check_dependencies()
+        
+        # Pay the JIT compile (or on-disk cache load) up front when effects run by default
+        if NUMBA_AVAILABLE and self.effects_params.get('enable_by_default', False):
+            self._warm_up_kernels()
+    
+    def _warm_up_kernels(self):
+        """Compile the effect kernels for the signatures the effects chain uses on 16-bit audio."""
+        # _enhance_harmonics always hands over float64 (frames, channels), and
+        # the fused pipeline passes the filtered int16 samples as one flat array
+        _enhance_kernel(np.zeros((256, 1), dtype=np.float64), 1.0)
+        lo, hi = _SAMPLE_LIMITS[2]
+        _mechanical_artifacts_kernel(np.zeros(256, dtype=np.int16), _ARTIFACT_MASKS[2], _ARTIFACT_GAIN, lo, hi)
     
     def _check_dependencies(self):
         """Check for required audio processing dependencies."""
@@ -58,6 +165,12 @@ class AudioProcessor:
             self.logger.warning(f"Missing audio dependencies: {', '.join(missing_deps)}")
             self.logger.warning("Some audio features may not be available")
     
+    def _bytes_to_segment(self, audio_data: Union[bytes, AudioSegment]) -> AudioSegment:
+        """Decode WAV bytes into an AudioSegment; segments pass through untouched."""
+        if isinstance(audio_data, AudioSegment):
+            return audio_data
+        return AudioSegment.from_wav(io.BytesIO(audio_data))
+    
     def load_audio_from_wav_data(self, wav_data: bytes) -> Optional[AudioSegment]:
         """Load audio from WAV byte data."""
         if not PYDUB_AVAILABLE:
@@ -66,7 +179,7 @@ class AudioProcessor:
         
         try:
             # Create AudioSegment from WAV bytes
-            audio = AudioSegment.from_wav(io.BytesIO(wav_data))
+            audio = self._bytes_to_segment(wav_data)
             return audio
         except Exception as e:
             self.logger.error(f"Error loading audio from WAV data: {e}")
@@ -78,24 +191,29 @@ class AudioProcessor:
             output_path = Path(output_path)
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            if isinstance(audio_data, bytes):
+            if isinstance(audio_data, _BYTES_LIKE):
                 # Raw WAV bytes - save directly
                 if format.lower() == 'wav':
                     with open(output_path, 'wb') as f:
                         f.write(audio_data)
                     return True
                 else:
-                    # Convert to AudioSegment for format conversion
+                    # Stream the WAV bytes through ffmpeg for format conversion
                     if not PYDUB_AVAILABLE:
                         self.logger.error("pydub required for format conversion")
                         return False
                     
-                    audio = AudioSegment.from_wav(io.BytesIO(audio_data))
-                    audio.export(output_path, format=format)
-                    return True
+                    return self._ffmpeg_convert(audio_data, 'wav', format, str(output_path)) is not None
             
             elif isinstance(audio_data, AudioSegment):
-                # AudioSegment object
+                # AudioSegment object - write 16/32-bit WAV straight from the PCM buffer
+                subtype = _SOUNDFILE_SUBTYPES.get(audio_data.sample_width)
+                if format.lower() == 'wav' and SOUNDFILE_AVAILABLE and subtype:
+                    samples = np.frombuffer(audio_data.raw_data, dtype=_SAMPLE_DTYPES[audio_data.sample_width])
+                    sf.write(str(output_path), samples.reshape(-1, audio_data.channels),
+                             audio_data.frame_rate, subtype=subtype)
+                    return True
+                
                 audio_data.export(output_path, format=format)
                 return True
             
@@ -107,6 +225,32 @@ class AudioProcessor:
             self.logger.error(f"Error saving audio to {output_path}: {e}")
             return False
     
+    def _ffmpeg_convert(self, audio_data: bytes, input_format: str, output_format: str,
+                        output_path: Optional[str] = None) -> Optional[bytes]:
+        """Convert audio by piping it through the encoder pydub is configured to use.
+        
+        Writes to output_path if given, otherwise returns the converted bytes.
+        Returns None on failure.
+        """
+        import subprocess
+        from pydub.utils import get_encoder_name
+        
+        cmd = [
+            get_encoder_name(), '-y', '-loglevel', 'error',
+            '-f', input_format, '-i', 'pipe:0',
+            '-f', output_format, output_path or 'pipe:1'
+        ]
+        
+        try:
+            result = subprocess.run(cmd, input=audio_data, capture_output=True, check=True)
+            return result.stdout
+        except (OSError, subprocess.CalledProcessError) as e:
+            stderr = getattr(e, 'stderr', None)
+            if stderr:
+                self.logger.error(f"ffmpeg stderr: {stderr.decode('utf-8', errors='ignore')}")
+            self.logger.error(f"Error converting audio to {output_format}: {e}")
+            return None
+    
     def play_audio(self, audio_data: Union[bytes, AudioSegment]) -> bool:
         """Play audio data using output directory instead of system temp files."""
         if not PYDUB_AVAILABLE:
@@ -114,11 +258,7 @@ class AudioProcessor:
             return False
         
         try:
-            if isinstance(audio_data, bytes):
-                audio = AudioSegment.from_wav(io.BytesIO(audio_data))
-            elif isinstance(audio_data, AudioSegment):
-                audio = audio_data
-            else:
+            if not isinstance(audio_data, (*_BYTES_LIKE, AudioSegment)):
                 self.logger.error(f"Unsupported audio data type: {type(audio_data)}")
                 return False
             
@@ -129,8 +269,13 @@ class AudioProcessor:
             # Ensure output directory exists
             output_dir.mkdir(parents=True, exist_ok=True)
             
-            # Save audio to temp file in output directory
-            audio.export(str(temp_playback_file), format="wav")
+            # Save audio to temp file in output directory; WAV bytes are written
+            # as-is and only decoded if playback has to fall back to pydub
+            if isinstance(audio_data, AudioSegment):
+                audio_data.export(str(temp_playback_file), format="wav")
+            else:
+                with open(temp_playback_file, 'wb') as f:
+                    f.write(audio_data)
             
             # Play using Windows built-in audio player to avoid pydub temp file issues
             if os.name == 'nt':  # Windows
@@ -148,7 +293,7 @@ class AudioProcessor:
                     except:
                         self.logger.warning("Could not play audio using Windows methods")
                         # Final fallback to original pydub method (may still fail)
-                        play(audio)
+                        play(self._bytes_to_segment(audio_data))
             else:
                 # For non-Windows systems, try alternative methods
                 try:
@@ -158,7 +303,7 @@ class AudioProcessor:
                         subprocess.run(['afplay', str(temp_playback_file)], check=True, timeout=30)
                     except:
                         # Final fallback to pydub
-                        play(audio)
+                        play(self._bytes_to_segment(audio_data))
             
             # Clean up temporary playback file
             try:
@@ -181,25 +326,33 @@ class AudioProcessor:
         
         try:
             # Convert to AudioSegment if needed
-            if isinstance(audio_data, bytes):
-                audio = AudioSegment.from_wav(io.BytesIO(audio_data))
-            elif isinstance(audio_data, AudioSegment):
-                audio = audio_data
+            if isinstance(audio_data, (*_BYTES_LIKE, AudioSegment)):
+                audio = self._bytes_to_segment(audio_data)
             else:
                 self.logger.error(f"Unsupported audio data type: {type(audio_data)}")
                 return None
             
+            # Common PCM widths run the whole chain on one NumPy buffer and
+            # spawn a single AudioSegment at the end
+            if SCIPY_AVAILABLE and audio.sample_width in _SAMPLE_DTYPES:
+                try:
+                    samples = np.frombuffer(audio.raw_data, dtype=_SAMPLE_DTYPES[audio.sample_width])
+                    samples = self._numpy_pipeline(samples.reshape(-1, audio.channels),
+                                                   audio.frame_rate, audio.sample_width)
+                    return audio._spawn(samples.tobytes())
+                except Exception as e:
+                    self.logger.warning(f"Error in fused effects pipeline, applying effects one by one: {e}")
+            
             # Apply frequency filtering
-            if self.effects_params.get('frequency_filter', {}).get('enable', True):
+            if self._filter_enabled:
                 audio = self._apply_frequency_filter(audio)
             
             # Apply harmonic enhancement
-            enhancement = self.effects_params.get('harmonic_enhancement', 1.0)
-            if enhancement != 1.0:
-                audio = self._apply_harmonic_enhancement(audio, enhancement)
+            if self._harmonic_factor != 1.0:
+                audio = self._apply_harmonic_enhancement(audio, self._harmonic_factor)
             
             # Apply mechanical artifacts
-            if self.effects_params.get('mechanical_artifacts', True):
+            if self._mechanical_artifacts:
                 audio = self._apply_mechanical_artifacts(audio)
             
             return audio
@@ -211,24 +364,83 @@ class AudioProcessor:
     def _apply_frequency_filter(self, audio: AudioSegment) -> AudioSegment:
         """Apply frequency filtering for robotic sound."""
         try:
-            filter_params = self.effects_params.get('frequency_filter', {})
-            low_cutoff = filter_params.get('low_cutoff', 300)
-            high_cutoff = filter_params.get('high_cutoff', 3000)
-            
-            # Apply high-pass filter (remove low frequencies)
-            if low_cutoff > 0:
-                audio = audio.high_pass_filter(low_cutoff)
+            low_cutoff = self._low_cutoff
+            high_cutoff = self._high_cutoff
+            
+            dtype = _SAMPLE_DTYPES.get(audio.sample_width)
+            if not SCIPY_AVAILABLE or dtype is None:
+                # Apply high-pass filter (remove low frequencies)
+                if low_cutoff > 0:
+                    audio = audio.high_pass_filter(low_cutoff)
+                
+                # Apply low-pass filter (remove high frequencies)
+                if high_cutoff < 20000:
+                    audio = audio.low_pass_filter(high_cutoff)
+                
+                return audio
             
-            # Apply low-pass filter (remove high frequencies)
-            if high_cutoff < 20000:
-                audio = audio.low_pass_filter(high_cutoff)
+            if self._get_bandpass_sos(audio.frame_rate) is None:
+                return audio
             
-            return audio
+            samples = np.frombuffer(audio.raw_data, dtype=dtype).reshape(-1, audio.channels)
+            filtered = self._filter_samples(samples, audio.frame_rate, audio.sample_width)
+            return audio._spawn(filtered.tobytes())
             
         except Exception as e:
             self.logger.warning(f"Error applying frequency filter: {e}")
             return audio
     
+    def _filter_samples(self, samples: np.ndarray, frame_rate: int, sample_width: int) -> np.ndarray:
+        """Band-limit (frames, channels) integer samples in a single pass."""
+        sos = self._get_bandpass_sos(frame_rate)
+        if sos is None:
+            return samples
+        
+        import scipy.signal
+        filtered = scipy.signal.sosfilt(sos, samples.astype(np.float32), axis=0)
+        lo, hi = _SAMPLE_LIMITS[sample_width]
+        np.clip(filtered, lo, hi, out=filtered)
+        return filtered.astype(samples.dtype)
+    
+    def _numpy_pipeline(self, samples: np.ndarray, frame_rate: int, sample_width: int) -> np.ndarray:
+        """Run the configured effects chain on (frames, channels) integer samples."""
+        if self._filter_enabled:
+            samples = self._filter_samples(samples, frame_rate, sample_width)
+        
+        if self._harmonic_factor != 1.0:
+            samples = self._enhance_harmonics(samples, self._harmonic_factor)
+        
+        if self._mechanical_artifacts:
+            lo, hi = _SAMPLE_LIMITS[sample_width]
+            samples = _mechanical_artifacts_kernel(samples.reshape(-1), _ARTIFACT_MASKS[sample_width],
+                                                   _ARTIFACT_GAIN, lo, hi)
+        
+        return samples
+    
+    def _get_bandpass_sos(self, frame_rate: int) -> Optional[np.ndarray]:
+        """Get the Butterworth filter for a frame rate, designing it on first use."""
+        if frame_rate not in self._bandpass_sos:
+            import scipy.signal
+            
+            low_cutoff = self._low_cutoff
+            high_cutoff = self._high_cutoff
+            nyquist = frame_rate / 2
+            use_high_pass = 0 < low_cutoff < nyquist
+            use_low_pass = high_cutoff < min(20000, nyquist)
+            
+            if use_high_pass and use_low_pass:
+                sos = scipy.signal.butter(4, [low_cutoff, high_cutoff], btype='band', fs=frame_rate, output='sos')
+            elif use_high_pass:
+                sos = scipy.signal.butter(4, low_cutoff, btype='high', fs=frame_rate, output='sos')
+            elif use_low_pass:
+                sos = scipy.signal.butter(4, high_cutoff, btype='low', fs=frame_rate, output='sos')
+            else:
+                sos = None
+            
+            self._bandpass_sos[frame_rate] = sos
+        
+        return self._bandpass_sos[frame_rate]
+    
     def _apply_harmonic_enhancement(self, audio: AudioSegment, factor: float) -> AudioSegment:
         """Apply harmonic enhancement for metallic sound."""
         try:
@@ -236,19 +448,14 @@ class AudioProcessor:
                 self.logger.warning("scipy not available for harmonic enhancement")
                 return audio
             
-            # Convert to numpy array
-            samples = np.array(audio.get_array_of_samples())
-            
-            if audio.channels == 2:
-                samples = samples.reshape((-1, 2))
-                # Process each channel
-                for i in range(2):
-                    channel_samples = samples[:, i]
-                    enhanced = self._enhance_harmonics(channel_samples, factor)
-                    samples[:, i] = enhanced
-                samples = samples.flatten()
+            # View the PCM buffer directly (read-only; _enhance_harmonics copies)
+            # as (frames, channels) so every channel is processed in one call
+            dtype = _SAMPLE_DTYPES.get(audio.sample_width)
+            if dtype is not None:
+                samples = np.frombuffer(audio.raw_data, dtype=dtype)
             else:
-                samples = self._enhance_harmonics(samples, factor)
+                samples = np.array(audio.get_array_of_samples())
+            samples = self._enhance_harmonics(samples.reshape(-1, audio.channels), factor)
             
             # Convert back to AudioSegment
             enhanced_audio = audio._spawn(samples.tobytes())
@@ -261,21 +468,12 @@ class AudioProcessor:
     def _enhance_harmonics(self, samples: np.ndarray, factor: float) -> np.ndarray:
         """Enhance harmonics in audio signal."""
         try:
-            # Simple harmonic enhancement using distortion
-            # Normalize to prevent clipping
-            max_val = np.max(np.abs(samples))
-            if max_val > 0:
-                normalized = samples / max_val
-                
-                # Apply soft clipping for harmonic distortion
-                enhanced = np.tanh(normalized * factor)
-                
-                # Scale back
-                enhanced = enhanced * max_val * 0.8  # Reduce volume slightly
-                
-                return enhanced.astype(samples.dtype)
-            
-            return samples
+            # Simple harmonic enhancement using soft-clipping distortion,
+            # scaled to 80% of each channel's original peak; float64 keeps
+            # 32-bit samples exact
+            buf = samples.astype(np.float64)
+            enhanced = _enhance_kernel(buf.reshape(len(buf), -1), factor)
+            return enhanced.reshape(samples.shape).astype(samples.dtype)
             
         except Exception as e:
             self.logger.warning(f"Error in harmonic enhancement: {e}")
@@ -284,10 +482,30 @@ class AudioProcessor:
     def _apply_mechanical_artifacts(self, audio: AudioSegment) -> AudioSegment:
         """Apply mechanical artifacts for robotic sound."""
         try:
-            # Add slight quantization effect
-            # Reduce bit depth temporarily to create digital artifacts
-            
-            # Convert to 8-bit and back to create quantization noise
+            # Add slight quantization effect: drop samples to 8-bit resolution
+            # by masking off everything below the top byte, and mix the result
+            # back in at -20 dB
+            dtype = _SAMPLE_DTYPES.get(audio.sample_width)
+            if dtype is not None:
+                samples = np.frombuffer(audio.raw_data, dtype=dtype)
+                lo, hi = _SAMPLE_LIMITS[audio.sample_width]
+                mixed = _mechanical_artifacts_kernel(samples, _ARTIFACT_MASKS[audio.sample_width],
+                                                     _ARTIFACT_GAIN, lo, hi)
+                return audio._spawn(mixed.tobytes())
+            
+            if audio.sample_width == 3:
+                # Widen packed 24-bit samples into the top three bytes of an
+                # int32 so the 32-bit mask keeps the same top byte; pydub
+                # widens 24-bit audio to 32-bit anyway, so keep it that way
+                packed = np.frombuffer(audio.raw_data, dtype=np.uint8).reshape(-1, 3)
+                widened = np.zeros((len(packed), 4), dtype=np.uint8)
+                widened[:, 1:] = packed
+                lo, hi = _SAMPLE_LIMITS[4]
+                mixed = _mechanical_artifacts_kernel(widened.view(np.int32).reshape(-1),
+                                                     _ARTIFACT_MASKS[4], _ARTIFACT_GAIN, lo, hi)
+                return audio._spawn(mixed.tobytes(), overrides={'sample_width': 4})
+            
+            # Any other sample width goes through pydub's conversions
             temp_audio = audio.set_sample_width(1)  # 8-bit
             temp_audio = temp_audio.set_sample_width(audio.sample_width)  # Back to original
             
@@ -303,16 +521,29 @@ class AudioProcessor:
     def normalize_audio(self, audio: AudioSegment, target_dBFS: float = -20.0) -> AudioSegment:
         """Normalize audio to target level."""
         try:
-            # Calculate current peak level
-            current_dBFS = audio.dBFS
-            
-            # Calculate gain needed
-            gain = target_dBFS - current_dBFS
-            
-            # Apply gain
-            normalized = audio + gain
-            
-            return normalized
+            dtype = _SAMPLE_DTYPES.get(audio.sample_width)
+            if dtype is None:
+                # Calculate current level and the gain needed, then apply it
+                return audio + (target_dBFS - audio.dBFS)
+            
+            samples = np.frombuffer(audio.raw_data, dtype=dtype)
+            
+            # Current RMS level relative to full scale; truncated to an
+            # integer like audioop.rms so the gain matches pydub's dBFS
+            rms = int(np.sqrt(np.mean(np.square(samples, dtype=np.float64)))) if samples.size else 0
+            if rms == 0:
+                return audio  # Silence cannot be normalized
+            
+            # Same dB arithmetic as `audio + (target_dBFS - audio.dBFS)`
+            gain = 10 ** ((target_dBFS - 20 * math.log10(rms / audio.max_possible_amplitude)) / 20)
+            
+            # Apply gain in float64 (exact for 32-bit samples) with
+            # saturation, flooring like audioop.mul
+            buf = samples * gain
+            lo, hi = _SAMPLE_LIMITS[audio.sample_width]
+            np.clip(buf, lo, hi, out=buf)
+            np.floor(buf, out=buf)
+            return audio._spawn(buf.astype(dtype).tobytes())
             
         except Exception as e:
             self.logger.warning(f"Error normalizing audio: {e}")
@@ -324,6 +555,19 @@ class AudioProcessor:
             if speed_factor == 1.0:
                 return audio
             
+            # Integer ratios are a plain frame stride (speed up) or frame
+            # repeat (slow down), with no resampling needed
+            dtype = _SAMPLE_DTYPES.get(audio.sample_width)
+            if dtype is not None and speed_factor > 0:
+                step = round(speed_factor)
+                repeat = round(1 / speed_factor)
+                if step >= 2 and abs(speed_factor - step) < 1e-6:
+                    frames = np.frombuffer(audio.raw_data, dtype=dtype).reshape(-1, audio.channels)
+                    return audio._spawn(frames[::step].tobytes())
+                if repeat >= 2 and abs(1 / speed_factor - repeat) < 1e-6:
+                    frames = np.frombuffer(audio.raw_data, dtype=dtype).reshape(-1, audio.channels)
+                    return audio._spawn(np.repeat(frames, repeat, axis=0).tobytes())
+            
             # Change frame rate to adjust speed
             new_frame_rate = int(audio.frame_rate * speed_factor)
             
@@ -347,7 +591,29 @@ class AudioProcessor:
         try:
             # Simple reverb using delayed copies
             delay_ms = int(room_size * 100)  # 0-100ms delay
-            decay = 1.0 - damping
+            
+            if audio.sample_width == 1:
+                # The pydub version mixes against 16-bit silence, so its output is 16-bit
+                audio = audio.set_sample_width(2)
+            
+            # pydub builds the delay from 11025 Hz silence resampled to the
+            # audio's rate; count its frames the same way to line up exactly
+            dtype = _SAMPLE_DTYPES.get(audio.sample_width)
+            if dtype is not None and audio.frame_rate >= 11025:
+                # Mix an attenuated, delayed copy in with one add over the overlap
+                gain = 10 ** (-damping)  # -20 dB per unit of damping
+                delay = int(AudioSegment.silent(duration=delay_ms).set_frame_rate(audio.frame_rate).frame_count())
+                
+                samples = np.frombuffer(audio.raw_data, dtype=dtype).reshape(-1, audio.channels)
+                mixed = samples.astype(np.int64)
+                if delay < len(samples):
+                    # Attenuate with floor and saturation like audioop.mul
+                    delayed = np.floor(samples[:len(samples) - delay] * gain)
+                    mixed[delay:] += delayed.astype(np.int64)
+                
+                lo, hi = _SAMPLE_LIMITS[audio.sample_width]
+                np.clip(mixed, lo, hi, out=mixed)
+                return audio._spawn(mixed.astype(dtype).tobytes())
             
             # Create delayed copy
             delayed = AudioSegment.silent(duration=delay_ms) + audio
@@ -380,15 +646,82 @@ class AudioProcessor:
             return {}
     
     def trim_silence(self, audio: AudioSegment, silence_thresh: float = -50.0) -> AudioSegment:
-        """Trim silence from beginning and end of audio."""
+        """Remove silences of a second or more, keeping 100 ms either side of speech."""
         try:
-            # Trim silence from start and end
-            trimmed = audio.strip_silence(silence_thresh=silence_thresh)
+            silent_ranges = self._detect_silence(audio, _SILENCE_LEN_MS, silence_thresh)
+            if silent_ranges is None:
+                # Trim silence from start and end
+                trimmed = audio.strip_silence(silence_len=_SILENCE_LEN_MS, silence_thresh=silence_thresh,
+                                              padding=_SILENCE_PADDING_MS)
+                return trimmed
+            
+            # Same splitting as pydub's strip_silence: the non-silent ranges,
+            # padded and split evenly where the padding overlaps, joined with
+            # a crossfade of half the padding
+            length = len(audio)
+            nonsilent = []
+            prev_end = 0
+            for start, end in silent_ranges:
+                nonsilent.append([prev_end, start])
+                prev_end = end
+            if not silent_ranges or silent_ranges[-1][1] != length:
+                nonsilent.append([prev_end, length])
+            if nonsilent and nonsilent[0] == [0, 0]:
+                nonsilent.pop(0)
+            if not nonsilent:
+                return audio[0:0]
+            
+            ranges = [[start - _SILENCE_PADDING_MS, end + _SILENCE_PADDING_MS] for start, end in nonsilent]
+            for current, following in zip(ranges, ranges[1:]):
+                if following[0] < current[1]:
+                    current[1] = following[0] = (current[1] + following[0]) // 2
+            
+            trimmed = None
+            for start, end in ranges:
+                chunk = audio[max(start, 0):min(end, length)]
+                trimmed = chunk if trimmed is None else trimmed.append(chunk, crossfade=_SILENCE_PADDING_MS / 2)
             return trimmed
         except Exception as e:
             self.logger.warning(f"Error trimming silence: {e}")
             return audio
     
+    def _detect_silence(self, audio: AudioSegment, min_silence_len: int, silence_thresh: float) -> Optional[list]:
+        """Find [start, end] ms ranges of silence like pydub's detect_silence, or None if unsupported."""
+        if audio.sample_width not in (1, 2):
+            return None  # Sums of squares of wider samples are not exact in float64
+        
+        length = len(audio)
+        if length < min_silence_len:
+            return []
+        
+        # RMS of the min_silence_len window starting at every millisecond,
+        # from a running sum of squares; pydub zero-pads windows that run
+        # past the last frame, which add nothing to the sum
+        samples = np.frombuffer(audio.raw_data, dtype=_SAMPLE_DTYPES[audio.sample_width])
+        frames = samples.reshape(-1, audio.channels).astype(np.int64)
+        cumulative = np.zeros(len(frames) + 1, dtype=np.int64)
+        np.cumsum(np.square(frames).sum(axis=1), out=cumulative[1:])
+        
+        ms_per_frame = audio.frame_rate / 1000.0
+        starts = np.arange(length - min_silence_len + 1)
+        start_frames = (starts * ms_per_frame).astype(np.int64)
+        end_frames = (np.minimum(starts + min_silence_len, length) * ms_per_frame).astype(np.int64)
+        sums = (cumulative[np.minimum(end_frames, len(frames))] - cumulative[np.minimum(start_frames, len(frames))])
+        counts = (end_frames - start_frames) * audio.channels
+        rms = np.floor(np.sqrt(sums / np.maximum(counts, 1)))
+        
+        threshold = 10 ** (silence_thresh / 20) * audio.max_possible_amplitude
+        silent_starts = np.flatnonzero(rms <= threshold)
+        if not len(silent_starts):
+            return []
+        
+        # Merge windows into ranges, breaking only where the next silent
+        # window starts after the previous one has ended
+        breaks = np.flatnonzero(np.diff(silent_starts) > min_silence_len)
+        range_starts = silent_starts[np.concatenate(([0], breaks + 1))]
+        range_ends = silent_starts[np.concatenate((breaks, [len(silent_starts) - 1]))] + min_silence_len
+        return [[int(start), int(end)] for start, end in zip(range_starts, range_ends)]
+    
     def fade_in_out(self, audio: AudioSegment, fade_in_ms: int = 50, fade_out_ms: int = 50) -> AudioSegment:
         """Apply fade in and fade out to audio."""
         try:
@@ -411,25 +744,8 @@ class AudioProcessor:
             self.logger.error("pydub not available for format conversion")
             return None
         
-        try:
-            # Load audio in input format
-            if input_format.lower() == 'wav':
-                audio = AudioSegment.from_wav(io.BytesIO(audio_data))
-            elif input_format.lower() == 'mp3':
-                audio = AudioSegment.from_mp3(io.BytesIO(audio_data))
-            else:
-                self.logger.error(f"Unsupported input format: {input_format}")
-                return None
-            
-            # Export in output format
-            output_buffer = io.BytesIO()
-            audio.export(output_buffer, format=output_format)
-            
-            return output_buffer.getvalue()
-            
-        except Exception as e:
-            self.logger.error(f"Error converting audio format: {e}")
-            return None
+        # Pipe straight through the encoder; no AudioSegment round trip needed
+        return self._ffmpeg_convert(audio_data, input_format.lower(), output_format)
     
     def create_silence(self, duration_ms: int) -> AudioSegment:
         """Create silent audio segment."""
@@ -445,6 +761,14 @@ class AudioProcessor:
             if not audio_segments:
                 return None
             
+            # Segments in the same PCM format can be joined with a single copy
+            first = audio_segments[0]
+            if all(segment.frame_rate == first.frame_rate and
+                   segment.channels == first.channels and
+                   segment.sample_width == first.sample_width
+                   for segment in audio_segments):
+                return first._spawn(b''.join(segment.raw_data for segment in audio_segments))
+            
             result = audio_segments[0]
             for segment in audio_segments[1:]:
                 result += segment
@@ -6,10 +6,69 @@ import os
 import yaml
 import json
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional, Union
 from src.utils import get_project_root
 
+# libyaml's C loader is much faster; it is only missing when PyYAML was built without it
+try:
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as _YAMLLoader
+
+_INT_KEYS = frozenset({'speed', 'pitch', 'amplitude', 'gap'})
+_BOOL_KEYS = frozenset({'enable_by_default', 'normalize_audio'})
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment variable value."""
+    return value.lower() in ('true', '1', 'yes', 'on')
+
+
+def _coercer(key: str):
+    """Pick the type conversion for an environment override key."""
+    if key in _INT_KEYS:
+        return int
+    if key in _BOOL_KEYS:
+        return _parse_bool
+    return str
+
+
+# Environment variable -> (section, key, type conversion)
+_ENV_MAPPING = {
+    env_var: (section, key, _coercer(key))
+    for env_var, (section, key) in {
+        'DJZ_SPEAK_SPEED': ('synthesis', 'speed'),
+        'DJZ_SPEAK_PITCH': ('synthesis', 'pitch'),
+        'DJZ_SPEAK_VOICE': ('synthesis', 'voice'),
+        'DJZ_SPEAK_OUTPUT_FORMAT': ('output', 'default_format'),
+        'DJZ_SPEAK_LOG_LEVEL': ('logging', 'level'),
+        'DJZ_SPEAK_ESPEAK_PATH': ('system', 'espeak_path'),
+    }.items()
+}
+
+
+@lru_cache(maxsize=None)
+def _resolve_path(base: Path, path: str) -> Path:
+    """Resolve a configured path, relative to base unless absolute."""
+    if not os.path.isabs(path):
+        return base / path
+    return Path(path)
+
+
+@lru_cache(maxsize=None)
+def _expand_cache_directory(cache_dir: str) -> Path:
+    """Expand the configured cache directory."""
+    return Path(cache_dir).expanduser()
+
+
+@lru_cache(maxsize=None)
+def _resolve_output_directory(base: Path, output_dir: str) -> Path:
+    """Resolve the configured output directory to an absolute path."""
+    # Resolve to absolute path to avoid any ambiguity
+    return _resolve_path(base, output_dir).resolve()
+
 
 class ConfigManager:
     """Manages configuration settings for DJZ-Speak."""
@@ -25,6 +84,7 @@ class ConfigManager:
         
         self.config_file = Path(config_file)
         self.config = {}
+        self._flat = {}
         self.user_config_dir = Path.home() / ".djz-speak"
         
         # Load configuration
@@ -40,7 +100,7 @@ class ConfigManager:
         try:
             if self.config_file.exists():
                 with open(self.config_file, 'r', encoding='utf-8') as f:
-                    self.config = yaml.safe_load(f) or {}
+                    self.config = yaml.load(f, Loader=_YAMLLoader) or {}
                 self.logger.debug(f"Loaded configuration from {self.config_file}")
             else:
                 self.logger.warning(f"Configuration file not found: {self.config_file}")
@@ -56,7 +116,7 @@ class ConfigManager:
         if user_config_file.exists():
             try:
                 with open(user_config_file, 'r', encoding='utf-8') as f:
-                    user_config = yaml.safe_load(f) or {}
+                    user_config = yaml.load(f, Loader=_YAMLLoader) or {}
                 
                 # Merge user config with default config
                 self._deep_merge(self.config, user_config)
@@ -66,32 +126,19 @@ class ConfigManager:
     
     def _apply_environment_overrides(self):
         """Apply environment variable overrides."""
-        env_mappings = {
-            'DJZ_SPEAK_SPEED': ('synthesis', 'speed'),
-            'DJZ_SPEAK_PITCH': ('synthesis', 'pitch'),
-            'DJZ_SPEAK_VOICE': ('synthesis', 'voice'),
-            'DJZ_SPEAK_OUTPUT_FORMAT': ('output', 'default_format'),
-            'DJZ_SPEAK_LOG_LEVEL': ('logging', 'level'),
-            'DJZ_SPEAK_ESPEAK_PATH': ('system', 'espeak_path'),
-        }
-        
-        for env_var, (section, key) in env_mappings.items():
-            value = os.getenv(env_var)
-            if value is not None:
-                if section not in self.config:
-                    self.config[section] = {}
-                
-                # Convert to appropriate type
-                if key in ['speed', 'pitch', 'amplitude', 'gap']:
-                    try:
-                        value = int(value)
-                    except ValueError:
-                        continue
-                elif key in ['enable_by_default', 'normalize_audio']:
-                    value = value.lower() in ('true', '1', 'yes', 'on')
-                
-                self.config[section][key] = value
-                self.logger.debug(f"Applied environment override: {env_var}={value}")
+        environ = os.environ
+        for env_var, (section, key, coerce) in _ENV_MAPPING.items():
+            value = environ.get(env_var)
+            if value is None:
+                continue
+            
+            try:
+                value = coerce(value)
+            except ValueError:
+                continue
+            
+            self.config.setdefault(section, {})[key] = value
+            self.logger.debug(f"Applied environment override: {env_var}={value}")
     
     def _validate_config(self):
         """Validate configuration values."""
@@ -129,6 +176,16 @@ class ConfigManager:
         
         if 'cache_size' in performance:
             performance['cache_size'] = max(1, min(1000, performance['cache_size']))
+        
+        self._rebuild_flat()
+    
+    def _rebuild_flat(self):
+        """Index every (section, key) value for single-lookup access in get()."""
+        self._flat = {
+            (section, key): value
+            for section, values in self.config.items() if isinstance(values, dict)
+            for key, value in values.items()
+        }
     
     def _get_fallback_config(self) -> Dict[str, Any]:
         """Get fallback configuration if file loading fails."""
@@ -172,6 +229,8 @@ class ConfigManager:
             },
             'system': {
                 'espeak_path': None,
+                'use_espeak_library': True,
+                'espeak_library': None,
                 'temp_directory': None,
                 'max_memory_usage': 100
             }
@@ -179,47 +238,54 @@ class ConfigManager:
     
     def _deep_merge(self, base: Dict, override: Dict):
         """Deep merge two dictionaries."""
-        for key, value in override.items():
-            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                self._deep_merge(base[key], value)
-            else:
-                base[key] = value
+        # Walk nested sections with an explicit stack rather than recursion
+        stack = [(base, override)]
+        while stack:
+            base_section, override_section = stack.pop()
+            for key, value in override_section.items():
+                if key in base_section and isinstance(base_section[key], dict) and isinstance(value, dict):
+                    stack.append((base_section[key], value))
+                else:
+                    base_section[key] = value
     
     def get(self, section: str, key: str = None, default: Any = None) -> Any:
         """Get configuration value."""
         if key is None:
             return self.config.get(section, default)
         
-        section_config = self.config.get(section, {})
-        return section_config.get(key, default)
+        return self._flat.get((section, key), default)
     
     def set(self, section: str, key: str, value: Any):
-        """Set configuration value."""
+        """Set configuration value.
+        
+        All changes must go through here so that get() stays in sync.
+        """
         if section not in self.config:
             self.config[section] = {}
         
         self.config[section][key] = value
+        self._flat[(section, key)] = value
         self.logger.debug(f"Set config: {section}.{key} = {value}")
     
     def get_synthesis_params(self) -> Dict[str, Any]:
-        """Get synthesis parameters."""
-        return self.config.get('synthesis', {})
+        """Get a copy of the synthesis parameters; change them with set()."""
+        return dict(self.config.get('synthesis', {}))
     
     def get_audio_params(self) -> Dict[str, Any]:
-        """Get audio parameters."""
-        return self.config.get('audio', {})
+        """Get a copy of the audio parameters; change them with set()."""
+        return dict(self.config.get('audio', {}))
     
     def get_effects_params(self) -> Dict[str, Any]:
-        """Get effects parameters."""
-        return self.config.get('effects', {})
+        """Get a copy of the effects parameters; change them with set()."""
+        return dict(self.config.get('effects', {}))
     
     def get_output_params(self) -> Dict[str, Any]:
-        """Get output parameters."""
-        return self.config.get('output', {})
+        """Get a copy of the output parameters; change them with set()."""
+        return dict(self.config.get('output', {}))
     
     def get_performance_params(self) -> Dict[str, Any]:
-        """Get performance parameters."""
-        return self.config.get('performance', {})
+        """Get a copy of the performance parameters; change them with set()."""
+        return dict(self.config.get('performance', {}))
     
     def get_espeak_path(self) -> Optional[str]:
         """Get eSpeak-NG executable path."""
@@ -228,11 +294,7 @@ class ConfigManager:
     def get_voice_presets_path(self) -> Path:
         """Get path to voice presets file."""
         presets_path = self.get('paths', 'voice_presets', 'config/default_voices.json')
-        
-        if not os.path.isabs(presets_path):
-            presets_path = self.project_root / presets_path
-        
-        return Path(presets_path)
+        return _resolve_path(self.project_root, presets_path)
     
     def get_user_presets_path(self) -> Path:
         """Get path to user voice presets file."""
@@ -242,7 +304,10 @@ class ConfigManager:
     def get_cache_directory(self) -> Path:
         """Get cache directory path."""
         cache_dir = self.get('paths', 'cache_directory', '~/.djz-speak/cache')
-        cache_path = Path(cache_dir).expanduser()
+        
+        # Only the path is memoized; long-lived sessions must survive the
+        # directory being removed underneath them
+        cache_path = _expand_cache_directory(cache_dir)
         cache_path.mkdir(parents=True, exist_ok=True)
         return cache_path
     
@@ -250,23 +315,14 @@ class ConfigManager:
         """Get default output directory path."""
         output_dir = self.get('output', 'default_output_directory', 'output')
         
-        if not os.path.isabs(output_dir):
-            output_dir = self.project_root / output_dir
-        else:
-            output_dir = Path(output_dir)
-        
-        # Resolve to absolute path to avoid any ambiguity
-        output_dir = output_dir.resolve()
-        
         # Create directory if it doesn't exist
         try:
-            output_dir.mkdir(parents=True, exist_ok=True)
-            self.logger.debug(f"Default output directory: {output_dir}")
+            output_path = _resolve_output_directory(self.project_root, output_dir)
+            output_path.mkdir(parents=True, exist_ok=True)
+            return output_path
         except Exception as e:
             self.logger.error(f"Failed to create output directory {output_dir}: {e}")
             raise
-        
-        return output_dir
     
     def save_user_config(self):
         """Save current configuration to user config file."""
@@ -316,7 +372,7 @@ class ConfigManager:
                     imported_config = json.load(f)
             else:
                 with open(file_path, 'r', encoding='utf-8') as f:
-                    imported_config = yaml.safe_load(f)
+                    imported_config = yaml.load(f, Loader=_YAMLLoader)
             
             # Merge imported config
             self._deep_merge(self.config, imported_config)
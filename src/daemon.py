@@ -0,0 +1,263 @@
+"""
+Warm synthesis daemon for DJZ-Speak
+
+Keeps a fully initialized TTS engine alive in a background process so that
+repeated CLI invocations only pay for an IPC round-trip instead of config
+parsing, voice loading and eSpeak-NG setup. Clients talk to it over a Unix
+domain socket (or a localhost TCP port on Windows) using length-prefixed
+messages: a JSON request in, raw WAV bytes out.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import queue
+import socket
+import struct
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from src.utils import get_project_root
+
+USE_UNIX_SOCKET = hasattr(socket, 'AF_UNIX') and os.name != 'nt'
+
+_HEADER = struct.Struct('>I')
+_STARTUP_TIMEOUT = 10.0
+
+logger = logging.getLogger(__name__)
+
+
+def _config_fingerprint(config_manager) -> str:
+    """Identify the effective configuration: config file, user overrides and environment."""
+    payload = json.dumps([str(config_manager.config_file.resolve()), config_manager.config],
+                         sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def _address_path(config_manager) -> Path:
+    """Get the socket (or port file, on Windows) path for the daemon.
+
+    The name is keyed on the effective configuration, so clients never reach
+    a daemon started with a different or since-edited config; an outdated
+    daemon is simply left to idle out.
+    """
+    suffix = 'sock' if USE_UNIX_SOCKET else 'port'
+    return config_manager.get_cache_directory() / f"daemon-{_config_fingerprint(config_manager)}.{suffix}"
+
+
+def _send_message(sock: socket.socket, payload: bytes):
+    """Send a length-prefixed message."""
+    sock.sendall(_HEADER.pack(len(payload)) + payload)
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    """Receive exactly size bytes."""
+    buf = bytearray()
+    while len(buf) < size:
+        chunk = sock.recv(min(size - len(buf), 1 << 16))
+        if not chunk:
+            raise ConnectionError("Connection closed mid-message")
+        buf += chunk
+    return bytes(buf)
+
+
+def _recv_message(sock: socket.socket) -> bytes:
+    """Receive a length-prefixed message."""
+    (size,) = _HEADER.unpack(_recv_exact(sock, _HEADER.size))
+    return _recv_exact(sock, size)
+
+
+def _connect(config_manager) -> Optional[socket.socket]:
+    """Connect to a running daemon, or return None if none is listening."""
+    address_path = _address_path(config_manager)
+    if not address_path.exists():
+        return None
+
+    try:
+        if USE_UNIX_SOCKET:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            address = str(address_path)
+        else:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            address = ('127.0.0.1', int(address_path.read_text().strip()))
+    except (OSError, ValueError):
+        return None
+
+    try:
+        sock.connect(address)
+        return sock
+    except OSError:
+        sock.close()
+        return None
+
+
+def _create_listener(config_manager) -> Optional[socket.socket]:
+    """Bind the daemon's listening socket, or return None if one is already running."""
+    existing = _connect(config_manager)
+    if existing is not None:
+        existing.close()
+        logger.info("Synthesis daemon already running")
+        return None
+
+    address_path = _address_path(config_manager)
+
+    if USE_UNIX_SOCKET:
+        # Remove a stale socket left behind by a daemon that did not shut down cleanly
+        try:
+            address_path.unlink()
+        except FileNotFoundError:
+            pass
+
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(str(address_path))
+        os.chmod(address_path, 0o600)
+    else:
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listener.bind(('127.0.0.1', 0))
+        address_path.write_text(str(listener.getsockname()[1]))
+
+    listener.listen(16)
+    return listener
+
+
+def _synthesize_request(engine, voice_manager, request: Dict[str, Any]) -> Optional[bytes]:
+    """Apply the requested voice settings and synthesize the text."""
+    voice_manager.set_voice(request.get('voice', 'classic_robot'))
+    engine.set_speed(int(request.get('speed', 140)))
+    engine.set_pitch(int(request.get('pitch', 35)))
+    engine.set_amplitude(int(request.get('amplitude', 100)))
+    engine.set_gap(int(request.get('gap', 8)))
+
+    audio_data = engine.synthesize(request['text'])
+    if audio_data and request.get('effects'):
+        audio_data = engine.apply_robotic_effects(audio_data)
+
+    return audio_data
+
+
+def _handle_connection(conn: socket.socket, engine, voice_manager):
+    """Serve a single client request."""
+    audio_data = None
+    try:
+        conn.settimeout(30)
+        request = json.loads(_recv_message(conn).decode('utf-8'))
+        audio_data = _synthesize_request(engine, voice_manager, request)
+    except Exception as e:
+        # Nothing a client sends may take the daemon down
+        logger.error(f"Invalid daemon request: {e}")
+
+    try:
+        # An empty reply tells the client to fall back to local synthesis
+        _send_message(conn, audio_data or b'')
+    except OSError as e:
+        logger.warning(f"Could not send daemon reply: {e}")
+
+
+def serve(config_file: Optional[str] = None):
+    """Run the synthesis daemon until it has been idle for the configured timeout."""
+    from src.config_manager import ConfigManager
+    from src.voice_manager import VoiceManager
+    from src.tts_engine import TTSEngine
+
+    config_manager = ConfigManager(config_file)
+    address_path = _address_path(config_manager)
+    voice_manager = VoiceManager(config_manager)
+    engine = TTSEngine(config_manager, voice_manager)
+    idle_timeout = config_manager.get('performance', 'daemon_idle_timeout', 600)
+
+    listener = _create_listener(config_manager)
+    if listener is None:
+        return
+
+    # Connections are accepted into a request pool and served one at a time
+    # by the single warm engine
+    pool = queue.Queue()
+
+    def accept_loop():
+        while True:
+            try:
+                conn, _ = listener.accept()
+            except OSError:
+                break
+            pool.put(conn)
+
+    threading.Thread(target=accept_loop, daemon=True).start()
+    logger.info(f"Synthesis daemon listening on {address_path}")
+
+    try:
+        while True:
+            try:
+                conn = pool.get(timeout=idle_timeout)
+            except queue.Empty:
+                logger.info("Synthesis daemon idle, shutting down")
+                break
+
+            with conn:
+                _handle_connection(conn, engine, voice_manager)
+    finally:
+        listener.close()
+        try:
+            address_path.unlink()
+        except OSError:
+            pass
+
+
+def _spawn(config_file: Optional[str] = None):
+    """Start the daemon in a detached background process."""
+    if getattr(sys, 'frozen', False):
+        cmd = [sys.executable, '--serve-daemon']
+    else:
+        cmd = [sys.executable, str(get_project_root() / 'main.py'), '--serve-daemon']
+
+    if config_file:
+        cmd += ['--config', str(Path(config_file).resolve())]
+
+    kwargs = {
+        'stdin': subprocess.DEVNULL,
+        'stdout': subprocess.DEVNULL,
+        'stderr': subprocess.DEVNULL,
+    }
+    if os.name == 'nt':
+        kwargs['creationflags'] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        kwargs['start_new_session'] = True
+
+    subprocess.Popen(cmd, **kwargs)
+
+
+def request_synthesis(config_manager, request: Dict[str, Any],
+                      config_file: Optional[str] = None, timeout: float = 30.0) -> Optional[bytes]:
+    """Synthesize through the daemon, starting it on first use.
+
+    Returns None if the daemon is unavailable or synthesis failed, in which
+    case the caller should synthesize locally.
+    """
+    try:
+        sock = _connect(config_manager)
+
+        if sock is None:
+            _spawn(config_file)
+            deadline = time.monotonic() + _STARTUP_TIMEOUT
+            while sock is None and time.monotonic() < deadline:
+                time.sleep(0.05)
+                sock = _connect(config_manager)
+
+        if sock is None:
+            logger.warning("Synthesis daemon did not start")
+            return None
+
+        with sock:
+            sock.settimeout(timeout)
+            _send_message(sock, json.dumps(request).encode('utf-8'))
+            audio_data = _recv_message(sock)
+
+        return audio_data or None
+
+    except (OSError, ValueError) as e:
+        logger.warning(f"Synthesis daemon request failed: {e}")
+        return None
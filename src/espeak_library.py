@@ -0,0 +1,154 @@
+"""
+In-process eSpeak-NG synthesis for DJZ-Speak
+
+Loads libespeak-ng through ctypes and keeps it initialized for the lifetime
+of the process, so each synthesis is a library call instead of a fork/exec
+of the espeak-ng executable plus a fresh voice load.
+"""
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import threading
+from typing import Any, Dict, Optional
+
+from src.utils import wav_header
+
+try:
+    import espeakng_loader
+    ESPEAKNG_LOADER_AVAILABLE = True
+except ImportError:
+    ESPEAKNG_LOADER_AVAILABLE = False
+
+# Values from speak_lib.h
+_AUDIO_OUTPUT_SYNCHRONOUS = 2
+_POS_CHARACTER = 1
+_CHARS_UTF8 = 1
+_ENDPAUSE = 0x1000
+_RATE = 1
+_VOLUME = 2
+_PITCH = 3
+_WORDGAP = 7
+
+_SynthCallback = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.POINTER(ctypes.c_short), ctypes.c_int, ctypes.c_void_p)
+
+_instance = None
+_instance_lock = threading.Lock()
+
+logger = logging.getLogger(__name__)
+
+
+def find_library(config_path: Optional[str] = None) -> Optional[str]:
+    """Find the libespeak-ng shared library."""
+    if config_path and os.path.exists(config_path):
+        return config_path
+
+    path = ctypes.util.find_library('espeak-ng')
+    if path:
+        return path
+
+    if ESPEAKNG_LOADER_AVAILABLE:
+        return espeakng_loader.get_library_path()
+
+    return None
+
+
+def _bundled_data_path(library_path: str) -> Optional[str]:
+    """Get espeakng_loader's data directory if library_path is its bundled library.
+
+    A system libespeak-ng must use its own compiled-in data directory.
+    """
+    if ESPEAKNG_LOADER_AVAILABLE and library_path == espeakng_loader.get_library_path():
+        return espeakng_loader.get_data_path()
+    return None
+
+
+class EspeakLibrary:
+    """A process-wide, initialized libespeak-ng handle."""
+
+    def __init__(self, library_path: str, data_path: Optional[str] = None):
+        """Load and initialize libespeak-ng."""
+        if data_path is None:
+            data_path = _bundled_data_path(library_path)
+
+        self._lib = ctypes.CDLL(library_path)
+        self._lib.espeak_Initialize.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_char_p, ctypes.c_int]
+        self._lib.espeak_SetVoiceByName.argtypes = [ctypes.c_char_p]
+        self._lib.espeak_SetParameter.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_int]
+        self._lib.espeak_Synth.argtypes = [
+            ctypes.c_char_p, ctypes.c_size_t, ctypes.c_uint, ctypes.c_int,
+            ctypes.c_uint, ctypes.c_uint, ctypes.c_void_p, ctypes.c_void_p
+        ]
+
+        self.sample_rate = self._lib.espeak_Initialize(
+            _AUDIO_OUTPUT_SYNCHRONOUS, 0,
+            data_path.encode() if data_path else None, 0
+        )
+        if self.sample_rate <= 0:
+            raise RuntimeError("libespeak-ng failed to initialize")
+
+        # The callback must stay referenced for as long as the library may call it
+        self._chunks = []
+        self._callback = _SynthCallback(self._collect)
+        self._lib.espeak_SetSynthCallback(self._callback)
+
+        self._voice = None
+        self._parameters = {}
+        self._lock = threading.Lock()
+
+    def _collect(self, wav, num_samples, events) -> int:
+        """Receive a block of synthesized samples."""
+        if num_samples > 0:
+            self._chunks.append(ctypes.string_at(wav, num_samples * 2))
+        return 0
+
+    def _set_parameter(self, parameter: int, value: int):
+        """Set a synthesis parameter if it changed since the last call."""
+        if self._parameters.get(parameter) != value:
+            self._lib.espeak_SetParameter(parameter, value, 0)
+            self._parameters[parameter] = value
+
+    def synthesize(self, text: str, voice_params: Dict[str, Any]) -> Optional[bytes]:
+        """Synthesize text to WAV bytes."""
+        voice = f"{voice_params.get('voice', 'en')}+{voice_params.get('variant', 'm3')}"
+        encoded = text.encode('utf-8')
+
+        with self._lock:
+            if voice != self._voice:
+                if self._lib.espeak_SetVoiceByName(voice.encode('utf-8')) != 0:
+                    logger.error(f"libespeak-ng could not load voice {voice}")
+                    return None
+                self._voice = voice
+                # Loading a voice resets the parameters
+                self._parameters.clear()
+
+            self._set_parameter(_RATE, int(voice_params.get('speed', 140)))
+            self._set_parameter(_PITCH, int(voice_params.get('pitch', 35)))
+            self._set_parameter(_VOLUME, int(voice_params.get('amplitude', 100)))
+            self._set_parameter(_WORDGAP, int(voice_params.get('gap', 8)))
+
+            self._chunks = []
+            result = self._lib.espeak_Synth(encoded, len(encoded) + 1, 0, _POS_CHARACTER, 0,
+                                            _CHARS_UTF8 | _ENDPAUSE, None, None)
+            chunks, self._chunks = self._chunks, []
+
+        if result != 0:
+            logger.error(f"libespeak-ng synthesis failed with code {result}")
+            return None
+
+        data = b''.join(chunks)
+        return wav_header(self.sample_rate, 2, 1, len(data)) + data
+
+
+def get_library(config_path: Optional[str] = None) -> Optional[EspeakLibrary]:
+    """Get the shared libespeak-ng handle, loading it on first use."""
+    global _instance
+
+    with _instance_lock:
+        if _instance is None:
+            library_path = find_library(config_path)
+            if library_path is None:
+                return None
+            _instance = EspeakLibrary(library_path)
+        return _instance
@@ -2,13 +2,20 @@
 Core TTS engine for DJZ-Speak using eSpeak-NG
 """
 
+import atexit
+import bisect
+import collections
+import concurrent.futures
 import io
 import logging
+import queue
+import re
 import subprocess
 import tempfile
+import threading
 import time
 from pathlib import Path
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, Callable, Union
 import os
 import shutil
 
@@ -21,7 +28,67 @@ except ImportError:
 from src.config_manager import ConfigManager
 from src.voice_manager import VoiceManager
 from src.audio_processor import AudioProcessor
-from src.utils import normalize_text, clamp
+from src.espeak_library import get_library
+from src.utils import normalize_text, wav_header
+
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Performance ratings for RTFs below each threshold, then above the last
+_RTF_THRESHOLDS = (0.1, 0.3, 0.5, 1.0)
+_RTF_LABELS = ("Excellent", "Very Good", "Good", "Acceptable", "Poor")
+
+# The eSpeak-NG Python library is initialized once per process and shared by all engines
+_espeak_ng_initialized = False
+_espeak_ng_lock = threading.Lock()
+
+
+def _initialize_espeak_ng():
+    """Initialize the eSpeak-NG Python library if this process has not yet."""
+    global _espeak_ng_initialized
+    
+    with _espeak_ng_lock:
+        if not _espeak_ng_initialized:
+            espeak_ng.initialize()
+            _espeak_ng_initialized = True
+            atexit.register(shutdown_espeak_ng)
+
+
+def shutdown_espeak_ng():
+    """Terminate the shared eSpeak-NG Python library; registered to run at process exit."""
+    global _espeak_ng_initialized
+    
+    with _espeak_ng_lock:
+        if _espeak_ng_initialized:
+            espeak_ng.terminate()
+            _espeak_ng_initialized = False
+
+
+# Engine reused by batch worker processes (engines are not picklable)
+_worker_engine = None
+_worker_config_file = None
+
+
+def get_worker_engine(config_file: str) -> 'TTSEngine':
+    """Get the TTS engine for this worker process, creating it on first use."""
+    global _worker_engine, _worker_config_file
+    
+    if _worker_engine is None or _worker_config_file != config_file:
+        config_manager = ConfigManager(config_file)
+        _worker_engine = TTSEngine(config_manager, VoiceManager(config_manager))
+        _worker_config_file = config_file
+    
+    return _worker_engine
+
+
+def _synthesize_one(args: tuple) -> bool:
+    """Synthesize one batch item to file (runs in a worker process)."""
+    text, output_path, voice_params, config_file, format, apply_effects = args
+    try:
+        engine = get_worker_engine(config_file)
+        return engine._synthesize_to_file_with_params(text, voice_params, output_path, format, apply_effects)
+    except Exception as e:
+        logging.getLogger(__name__).error(f"Error synthesizing {output_path}: {e}")
+        return False
 
 
 class TTSEngine:
@@ -47,6 +114,16 @@ class TTSEngine:
             'average_rtf': 0.0
         }
         
+        # Recently synthesized audio, keyed on normalized text and voice parameters;
+        # synthesize_streaming fills it from a helper thread, hence the lock
+        self._audio_cache = collections.OrderedDict()
+        self._audio_cache_size = config_manager.get('performance', 'memory_cache_entries', 128)
+        self._audio_cache_lock = threading.Lock()
+        
+        # (key, argv without the text) for the last voice parameters used,
+        # replaced as a whole so readers on other threads see a matching pair
+        self._argv_prefix = None
+        
         # Initialize eSpeak-NG
         self._initialize_espeak()
     
@@ -54,22 +131,34 @@ class TTSEngine:
         """Initialize eSpeak-NG engine."""
         self.espeak_method = None
         self.espeak_path = None
+        self.espeak_library = None
         
         # Try Python library first
         if ESPEAK_NG_PYTHON_AVAILABLE:
             try:
-                espeak_ng.initialize()
+                _initialize_espeak_ng()
                 self.espeak_method = 'python'
                 self.logger.info("Initialized eSpeak-NG Python library")
                 return
             except Exception as e:
                 self.logger.warning(f"Failed to initialize eSpeak-NG Python library: {e}")
         
+        # Then a persistent in-process libespeak-ng, which avoids a fork/exec per synthesis
+        if self.config_manager.get('system', 'use_espeak_library', True):
+            try:
+                self.espeak_library = get_library(self.config_manager.get('system', 'espeak_library'))
+                if self.espeak_library:
+                    self.espeak_method = 'library'
+                    self.logger.info("Using in-process libespeak-ng")
+                    return
+            except Exception as e:
+                self.logger.warning(f"Failed to load libespeak-ng: {e}")
+        
         # Fall back to subprocess
         self.espeak_path = self._find_espeak_executable()
         if self.espeak_path:
             self.espeak_method = 'subprocess'
-            self.logger.info(f"Using eSpeak-NG executable: {self.espeak_path}")
+            self.logger.info("Using eSpeak-NG executable: %s", self.espeak_path)
         else:
             self.logger.error("eSpeak-NG not found. Please install eSpeak-NG.")
             raise RuntimeError("eSpeak-NG not available")
@@ -78,7 +167,7 @@ class TTSEngine:
         """Find eSpeak-NG executable."""
         # Check config first
         config_path = self.config_manager.get_espeak_path()
-        if config_path and Path(config_path).exists():
+        if config_path and os.path.exists(config_path):
             return config_path
         
         # Common executable names
@@ -100,14 +189,27 @@ class TTSEngine:
         ]
         
         for path in common_paths:
-            if Path(path).exists():
+            if os.path.exists(path):
                 return path
         
         return None
     
-    def synthesize(self, text: str) -> Optional[bytes]:
-        """Synthesize text to audio."""
-        if not text or not text.strip():
+    def synthesize(self, text: str, validated: bool = False,
+                   voice_params: Optional[Dict[str, Any]] = None) -> Optional[bytes]:
+        """Synthesize text to audio.
+        
+        Pass validated=True when the caller has already run validate_text_input,
+        and voice_params to use parameters resolved earlier instead of the
+        current voice.
+        """
+        if voice_params is None:
+            voice_params = self.voice_manager.get_espeak_parameters()
+        return self._synthesize_with_params(text, voice_params, validated)
+    
+    def _synthesize_with_params(self, text: str, voice_params: Dict[str, Any],
+                                validated: bool = False) -> Optional[bytes]:
+        """Synthesize text to audio with already resolved voice parameters."""
+        if not validated and (not text or not text.strip()):
             self.logger.warning("Empty text provided for synthesis")
             return None
         
@@ -117,12 +219,23 @@ class TTSEngine:
             # Normalize text
             normalized_text = normalize_text(text)
             
-            # Get voice parameters
-            voice_params = self.voice_manager.get_espeak_parameters()
+            cache_key = (
+                normalized_text,
+                voice_params.get('voice'), voice_params.get('variant'),
+                voice_params.get('speed'), voice_params.get('pitch'),
+                voice_params.get('amplitude'), voice_params.get('gap')
+            )
+            with self._audio_cache_lock:
+                audio_data = self._audio_cache.get(cache_key)
+                if audio_data is not None:
+                    self._audio_cache.move_to_end(cache_key)
+                    return audio_data
             
             # Synthesize audio
             if self.espeak_method == 'python':
                 audio_data = self._synthesize_python(normalized_text, voice_params)
+            elif self.espeak_method == 'library':
+                audio_data = self.espeak_library.synthesize(normalized_text, voice_params)
             elif self.espeak_method == 'subprocess':
                 audio_data = self._synthesize_subprocess(normalized_text, voice_params)
             else:
@@ -133,6 +246,12 @@ class TTSEngine:
             synthesis_time = time.time() - start_time
             self._update_stats(synthesis_time, len(normalized_text))
             
+            if audio_data and self._audio_cache_size > 0:
+                with self._audio_cache_lock:
+                    self._audio_cache[cache_key] = audio_data
+                    if len(self._audio_cache) > self._audio_cache_size:
+                        self._audio_cache.popitem(last=False)
+            
             return audio_data
             
         except Exception as e:
@@ -163,23 +282,92 @@ class TTSEngine:
             self.logger.error(f"Error in Python synthesis: {e}")
             return None
     
+    def synthesize_streaming(self, text: str, sink: Optional[Callable[[bytes], Any]] = None,
+                             voice_params: Optional[Dict[str, Any]] = None) -> bool:
+        """Synthesize text sentence by sentence, handing each to sink as soon as it is ready.
+        
+        Synthesis of the next sentence overlaps with the sink consuming the
+        current one; the sink defaults to audio playback. voice_params works
+        as for synthesize.
+        """
+        if sink is None:
+            sink = self.audio_processor.play_audio
+        
+        sentences = [s for s in _SENTENCE_SPLIT_RE.split(text.strip()) if s]
+        if not sentences:
+            self.logger.warning("Empty text provided for synthesis")
+            return False
+        
+        if voice_params is None:
+            voice_params = self.voice_manager.get_espeak_parameters()
+        chunks = queue.Queue(maxsize=2)
+        stop = threading.Event()
+        
+        def produce():
+            for sentence in sentences:
+                if stop.is_set():
+                    break
+                chunks.put(self._synthesize_with_params(sentence, voice_params))
+            chunks.put(None)
+        
+        threading.Thread(target=produce, daemon=True).start()
+        
+        success = True
+        try:
+            for audio_data in iter(chunks.get, None):
+                if audio_data:
+                    sink(audio_data)
+                else:
+                    success = False
+        finally:
+            # If the sink failed, stop the producer and make room for its
+            # last puts so it can finish instead of blocking forever
+            stop.set()
+            while True:
+                try:
+                    chunks.get_nowait()
+                except queue.Empty:
+                    break
+        
+        return success
+    
+    def _espeak_command(self, voice_params: Dict[str, Any]) -> list:
+        """Build the eSpeak-NG command line, without the text to speak.
+        
+        The list is cached and shared between calls; callers must not modify it.
+        """
+        key = (
+            self.espeak_path,
+            voice_params.get('voice'), voice_params.get('variant'),
+            voice_params.get('speed'), voice_params.get('pitch'),
+            voice_params.get('amplitude'), voice_params.get('gap')
+        )
+        cached = self._argv_prefix
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        # Ensure we're using stdout to avoid temp files
+        argv = [
+            self.espeak_path,
+            '-v', f"{voice_params.get('voice', 'en')}+{voice_params.get('variant', 'm3')}",
+            '-s', str(voice_params.get('speed', 140)),
+            '-p', str(voice_params.get('pitch', 35)),
+            '-a', str(voice_params.get('amplitude', 100)),
+            '-g', str(voice_params.get('gap', 8)),
+            '--stdout'  # Critical: this ensures output goes to stdout, not temp files
+        ]
+        self._argv_prefix = (key, argv)
+        return argv
+    
     def _synthesize_subprocess(self, text: str, voice_params: Dict[str, Any]) -> Optional[bytes]:
         """Synthesize using eSpeak-NG subprocess."""
+        # Add text as argument (avoid temp files for text input); the cached
+        # prefix itself is never modified
+        return self._run_espeak(self._espeak_command(voice_params) + [text])
+    
+    def _run_espeak(self, cmd: list) -> Optional[bytes]:
+        """Run an eSpeak-NG command and return the WAV it writes to stdout."""
         try:
-            # Build command - ensure we're using stdout to avoid temp files
-            cmd = [
-                self.espeak_path,
-                '-v', f"{voice_params.get('voice', 'en')}+{voice_params.get('variant', 'm3')}",
-                '-s', str(voice_params.get('speed', 140)),
-                '-p', str(voice_params.get('pitch', 35)),
-                '-a', str(voice_params.get('amplitude', 100)),
-                '-g', str(voice_params.get('gap', 8)),
-                '--stdout'  # Critical: this ensures output goes to stdout, not temp files
-            ]
-            
-            # Add text as argument (avoid temp files for text input)
-            cmd.append(text)
-            
             # Execute command with proper environment
             env = os.environ.copy()
             # Ensure no temp directory environment variables interfere
@@ -187,16 +375,19 @@ class TTSEngine:
             env.pop('TMP', None)
             env.pop('TEMP', None)
             
+            # close_fds=False with no cwd/preexec_fn lets subprocess use
+            # posix_spawn instead of fork+exec; Python's own descriptors are
+            # non-inheritable anyway, and every path passed is absolute
             result = subprocess.run(
                 cmd,
                 capture_output=True,
                 timeout=30,
                 check=True,
                 env=env,
-                cwd=self.config_manager.project_root  # Set working directory explicitly
+                close_fds=False
             )
             
-            self.logger.debug(f"eSpeak subprocess completed, stdout size: {len(result.stdout)} bytes")
+            self.logger.debug("eSpeak subprocess completed, stdout size: %d bytes", len(result.stdout))
             return result.stdout
             
         except subprocess.TimeoutExpired:
@@ -221,36 +412,35 @@ class TTSEngine:
         estimated_audio_duration = text_length / (self.current_speed / 60.0 * 5)  # ~5 chars per word
         rtf = synthesis_time / max(estimated_audio_duration, 0.1)
         
-        # Update average RTF
-        total_syntheses = self.synthesis_stats['total_syntheses']
+        # Update average RTF (running mean)
         current_avg = self.synthesis_stats['average_rtf']
-        self.synthesis_stats['average_rtf'] = (current_avg * (total_syntheses - 1) + rtf) / total_syntheses
+        self.synthesis_stats['average_rtf'] = current_avg + (rtf - current_avg) / self.synthesis_stats['total_syntheses']
         
-        self.logger.debug(f"Synthesis time: {synthesis_time:.3f}s, RTF: {rtf:.3f}")
+        self.logger.debug("Synthesis time: %.3fs, RTF: %.3f", synthesis_time, rtf)
     
     def set_speed(self, speed: int):
         """Set speech speed in words per minute."""
-        self.current_speed = clamp(speed, 80, 300)
+        self.current_speed = 80 if speed < 80 else 300 if speed > 300 else speed
         self.voice_manager.update_parameter('speed', self.current_speed)
-        self.logger.debug(f"Set speed to {self.current_speed} WPM")
+        self.logger.debug("Set speed to %s WPM", self.current_speed)
     
     def set_pitch(self, pitch: int):
         """Set pitch level (0-99)."""
-        self.current_pitch = clamp(pitch, 0, 99)
+        self.current_pitch = 0 if pitch < 0 else 99 if pitch > 99 else pitch
         self.voice_manager.update_parameter('pitch', self.current_pitch)
-        self.logger.debug(f"Set pitch to {self.current_pitch}")
+        self.logger.debug("Set pitch to %s", self.current_pitch)
     
     def set_amplitude(self, amplitude: int):
         """Set amplitude/volume level (0-200)."""
-        self.current_amplitude = clamp(amplitude, 0, 200)
+        self.current_amplitude = 0 if amplitude < 0 else 200 if amplitude > 200 else amplitude
         self.voice_manager.update_parameter('amplitude', self.current_amplitude)
-        self.logger.debug(f"Set amplitude to {self.current_amplitude}")
+        self.logger.debug("Set amplitude to %s", self.current_amplitude)
     
     def set_gap(self, gap: int):
         """Set word gap in 10ms units."""
-        self.current_gap = clamp(gap, 0, 100)
+        self.current_gap = 0 if gap < 0 else 100 if gap > 100 else gap
         self.voice_manager.update_parameter('gap', self.current_gap)
-        self.logger.debug(f"Set gap to {self.current_gap}")
+        self.logger.debug("Set gap to %s", self.current_gap)
     
     def play_audio(self, audio_data: bytes) -> bool:
         """Play audio data."""
@@ -260,27 +450,45 @@ class TTSEngine:
         """Save audio data to file."""
         return self.audio_processor.save_audio(audio_data, output_path, format)
     
-    def apply_robotic_effects(self, audio_data: bytes):
-        """Apply robotic effects to audio."""
+    def apply_robotic_effects(self, audio_data: bytes, as_bytes: bool = True):
+        """Apply robotic effects to audio.
+        
+        With as_bytes=False the processed AudioSegment is returned as-is, so
+        callers that go on to save or play it avoid a WAV encode/decode.
+        """
         audio_segment = self.audio_processor.apply_robotic_effects(audio_data)
+        if audio_segment and not as_bytes:
+            return audio_segment
         if audio_segment:
-            # Convert back to bytes
-            output_buffer = io.BytesIO()
-            audio_segment.export(output_buffer, format='wav')
-            return output_buffer.getvalue()
+            if audio_segment.sample_width == 1:
+                # 8-bit WAV is unsigned, so let pydub convert it
+                output_buffer = io.BytesIO()
+                audio_segment.export(output_buffer, format='wav')
+                return output_buffer.getvalue()
+            
+            # Convert back to WAV bytes without going through pydub's export
+            raw_data = audio_segment.raw_data
+            return wav_header(audio_segment.frame_rate, audio_segment.sample_width,
+                              audio_segment.channels, len(raw_data)) + raw_data
         return audio_data
     
     def synthesize_to_file(self, text: str, output_path: str, format: str = 'wav', apply_effects: bool = False) -> bool:
         """Synthesize text directly to file."""
+        return self._synthesize_to_file_with_params(text, self.voice_manager.get_espeak_parameters(),
+                                                    output_path, format, apply_effects)
+    
+    def _synthesize_to_file_with_params(self, text: str, voice_params: Dict[str, Any], output_path: str,
+                                        format: str = 'wav', apply_effects: bool = False) -> bool:
+        """Synthesize text to file with already resolved voice parameters."""
         try:
             # Synthesize audio
-            audio_data = self.synthesize(text)
+            audio_data = self._synthesize_with_params(text, voice_params)
             if not audio_data:
                 return False
             
             # Apply effects if requested
             if apply_effects:
-                audio_data = self.apply_robotic_effects(audio_data)
+                audio_data = self.apply_robotic_effects(audio_data, as_bytes=False)
             
             # Save to file
             return self.save_audio(audio_data, output_path, format)
@@ -290,27 +498,40 @@ class TTSEngine:
             return False
     
     def batch_synthesize(self, texts: list, output_dir: str, format: str = 'wav', apply_effects: bool = False) -> Dict[str, bool]:
-        """Synthesize multiple texts to files."""
-        results = {}
+        """Synthesize multiple texts to files, in parallel across worker processes."""
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
-        for i, text in enumerate(texts):
+        # Snapshot the shared cached dict so jobs never see later changes to it
+        voice_params = dict(self.voice_manager.get_espeak_parameters())
+        config_file = str(self.config_manager.config_file)
+        filenames = [f"synthesis_{i+1:03d}.{format}" for i in range(len(texts))]
+        jobs = [
+            (text, str(output_path / filename), voice_params, config_file, format, apply_effects)
+            for text, filename in zip(texts, filenames)
+        ]
+        
+        successes = None
+        if len(jobs) > 1:
             try:
-                filename = f"synthesis_{i+1:03d}.{format}"
-                file_path = output_path / filename
-                
-                success = self.synthesize_to_file(text, str(file_path), format, apply_effects)
-                results[filename] = success
-                
-                if success:
-                    self.logger.debug(f"Synthesized: {filename}")
-                else:
-                    self.logger.warning(f"Failed to synthesize: {filename}")
-                    
-            except Exception as e:
-                self.logger.error(f"Error in batch synthesis for text {i+1}: {e}")
-                results[f"synthesis_{i+1:03d}.{format}"] = False
+                max_workers = min(len(jobs), os.cpu_count() or 1)
+                with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    successes = list(executor.map(_synthesize_one, jobs))
+            except (OSError, concurrent.futures.process.BrokenProcessPool) as e:
+                self.logger.warning(f"Parallel batch synthesis unavailable, running sequentially: {e}")
+        
+        if successes is None:
+            successes = [self._synthesize_to_file_with_params(text, voice_params, path, format, apply_effects)
+                         for text, path, *_ in jobs]
+        
+        results = {}
+        for filename, success in zip(filenames, successes):
+            results[filename] = success
+            
+            if success:
+                self.logger.debug("Synthesized: %s", filename)
+            else:
+                self.logger.warning(f"Failed to synthesize: {filename}")
         
         return results
     
@@ -361,16 +582,7 @@ class TTSEngine:
     
     def _get_performance_rating(self, rtf: float) -> str:
         """Get performance rating based on RTF."""
-        if rtf < 0.1:
-            return "Excellent"
-        elif rtf < 0.3:
-            return "Very Good"
-        elif rtf < 0.5:
-            return "Good"
-        elif rtf < 1.0:
-            return "Acceptable"
-        else:
-            return "Poor"
+        return _RTF_LABELS[bisect.bisect_right(_RTF_THRESHOLDS, rtf)]
     
     def reset_statistics(self):
         """Reset synthesis statistics."""
@@ -381,11 +593,21 @@ class TTSEngine:
         }
         self.logger.info("Reset synthesis statistics")
     
+    def reset_cache(self):
+        """Drop all cached synthesized audio."""
+        with self._audio_cache_lock:
+            self._audio_cache.clear()
+        self.logger.info("Reset synthesis cache")
+    
     def cleanup(self):
-        """Cleanup resources."""
+        """Cleanup resources.
+        
+        The shared eSpeak-NG library stays loaded for other engines in this
+        process and is terminated at exit.
+        """
         try:
-            if self.espeak_method == 'python' and ESPEAK_NG_PYTHON_AVAILABLE:
-                espeak_ng.terminate()
+            with self._audio_cache_lock:
+                self._audio_cache.clear()
             self.logger.debug("TTS engine cleanup completed")
         except Exception as e:
             self.logger.warning(f"Error during cleanup: {e}")
@@ -2,12 +2,42 @@
 Utility functions for DJZ-Speak TTS tool
 """
 
+import collections
 import logging
 import re
+import string
+import struct
 import sys
+import threading
+import time
+from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+_VALID_TEXT_RE = re.compile(r'^[\w\s\.,!?;:\'"()\-\[\]{}@#$%^&*+=<>/\\|`~]*$')
+# ASCII subset of _VALID_TEXT_RE's character class
+_VALID_CHARS = frozenset(string.ascii_letters + string.digits + string.whitespace +
+                         '_.,!?;:\'"()-[]{}@#$%^&*+=<>/\\|`~')
+_FILENAME_TRANS = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+_TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+# Anything normalize_text would change, short of the final punctuation and edge spaces
+_NEEDS_NORMALIZE_RE = re.compile(r'\s\s|[^\S ]|[\u201c\u201d\u2018\u2019]|[.!?][A-Z]')
+# Whitespace runs, curly double quotes, curly single quotes, or a sentence
+# boundary, handled together in a single scan by _normalize_match
+_NORMALIZE_RE = re.compile(r'(\s+)|([\u201c\u201d])|([\u2018\u2019])|([.!?])(\s*)([A-Z])')
+
+
+def _normalize_match(match: re.Match) -> str:
+    """Replacement for one _NORMALIZE_RE match."""
+    kind = match.lastindex
+    if kind == 1:
+        return ' '
+    if kind == 2:
+        return '"'
+    if kind == 3:
+        return "'"
+    return f"{match.group(4)} {match.group(6)}"
+
 
 def setup_logging(level: str = 'INFO'):
     """Setup logging configuration."""
@@ -36,26 +66,19 @@ def validate_text_input(text: str) -> bool:
     if len(text) > 10000:
         return False
     
-    # Check for valid characters (allow letters, numbers, punctuation, whitespace)
-    if not re.match(r'^[\w\s\.,!?;:\'"()\-\[\]{}@#$%^&*+=<>/\\|`~]*$', text):
-        return False
+    # Short ASCII text can be checked without the regex
+    if len(text) < 64 and _VALID_CHARS.issuperset(text):
+        return True
     
-    return True
+    # Check for valid characters (allow letters, numbers, punctuation, whitespace)
+    return _VALID_TEXT_RE.match(text) is not None
 
 
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename for cross-platform compatibility."""
-    # Remove invalid characters
-    filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
-    
-    # Remove leading/trailing dots and spaces
-    filename = filename.strip('. ')
-    
-    # Ensure not empty
-    if not filename:
-        filename = 'output'
-    
-    return filename
+    # Replace invalid characters, remove leading/trailing dots and spaces,
+    # and ensure not empty
+    return filename.translate(_FILENAME_TRANS).strip('. ') or 'output'
 
 
 def ensure_directory(path: str) -> Path:
@@ -65,6 +88,16 @@ def ensure_directory(path: str) -> Path:
     return dir_path
 
 
+def wav_header(frame_rate: int, sample_width: int, channels: int, data_size: int) -> bytes:
+    """Build a 44-byte PCM WAV header."""
+    block_align = sample_width * channels
+    return struct.pack('<4sI4s4sIHHIIHH4sI',
+                       b'RIFF', 36 + data_size, b'WAVE',
+                       b'fmt ', 16, 1, channels, frame_rate, frame_rate * block_align,
+                       block_align, sample_width * 8,
+                       b'data', data_size)
+
+
 def get_project_root() -> Path:
     """Get the project root directory."""
     return Path(__file__).parent.parent
@@ -84,20 +117,18 @@ def format_duration(seconds: float) -> str:
 
 def clamp(value: float, min_val: float, max_val: float) -> float:
     """Clamp value between min and max."""
-    return max(min_val, min(value, max_val))
+    return min_val if value < min_val else max_val if value > max_val else value
 
 
 def normalize_text(text: str) -> str:
     """Normalize text for better TTS synthesis."""
-    # Replace multiple whitespace with single space
-    text = re.sub(r'\s+', ' ', text)
-    
-    # Normalize quotes
-    text = text.replace('"', '"').replace('"', '"')
-    text = text.replace(''', "'").replace(''', "'")
+    # Text that is already normalized is returned as-is after a single scan
+    if text and text[-1] in '.!?' and text[0] != ' ' and not _NEEDS_NORMALIZE_RE.search(text):
+        return text
     
-    # Ensure proper sentence endings
-    text = re.sub(r'([.!?])\s*([A-Z])', r'\1 \2', text)
+    # Collapse whitespace, normalize quotes and ensure proper sentence
+    # endings in one pass
+    text = _NORMALIZE_RE.sub(_normalize_match, text)
     
     # Add period if text doesn't end with punctuation
     if text and not text[-1] in '.!?':
@@ -136,10 +167,22 @@ def parse_time_string(time_str: str) -> Optional[float]:
 
 def get_audio_info(audio_data: bytes) -> dict:
     """Get basic information about audio data."""
+    bytes_per_sec = 0
+    if len(audio_data) >= 44 and audio_data[:4] == b'RIFF':
+        # Read the format from the WAV header
+        channels, sample_rate = struct.unpack_from('<HI', audio_data, 22)
+        (bits_per_sample,) = struct.unpack_from('<H', audio_data, 34)
+        bytes_per_sec = sample_rate * channels * bits_per_sample // 8
+    
+    if bytes_per_sec:
+        estimated_duration = (len(audio_data) - 44) / bytes_per_sec
+    else:
+        estimated_duration = len(audio_data) / (44100 * 2 * 2)  # Rough estimate for 16-bit stereo
+    
     return {
         'size_bytes': len(audio_data),
         'size_kb': len(audio_data) / 1024,
-        'estimated_duration': len(audio_data) / (44100 * 2 * 2)  # Rough estimate for 16-bit stereo
+        'estimated_duration': estimated_duration
     }
 
 
@@ -150,11 +193,23 @@ class ProgressBar:
         self.total = total
         self.width = width
         self.current = 0
+        
+        # Redraw at most every ~0.5% of progress or 50 ms, whichever comes first
+        self._draw_every = max(1, total // 200)
+        self._last_drawn = 0
+        self._last_draw_time = 0.0
     
     def update(self, increment: int = 1):
         """Update progress bar."""
         self.current += increment
-        self._display()
+        
+        now = time.monotonic()
+        if (self.current - self._last_drawn >= self._draw_every
+                or now - self._last_draw_time > 0.05
+                or self.current >= self.total):
+            self._last_drawn = self.current
+            self._last_draw_time = now
+            self._display()
     
     def _display(self):
         """Display current progress."""
@@ -171,6 +226,69 @@ class ProgressBar:
             print()  # New line when complete
 
 
+class TimedBuffer:
+    """Buffer small file writes and flush them from one background thread.
+    
+    Pending writes are flushed every flush_interval seconds, or sooner once
+    more than flush_bytes are buffered.
+    """
+    
+    def __init__(self, flush_bytes: int = 4 * 1024 * 1024, flush_interval: float = 0.05):
+        self.flush_bytes = flush_bytes
+        self.flush_interval = flush_interval
+        self.results = {}
+        self._pending = collections.deque()
+        self._pending_bytes = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    def write(self, path: str, data: bytes):
+        """Queue data to be written to path."""
+        with self._cond:
+            # Apply back-pressure rather than buffering without bound
+            while self._pending_bytes >= 2 * self.flush_bytes:
+                self._cond.wait()
+            self._pending.append((path, data))
+            self._pending_bytes += len(data)
+            if self._pending_bytes >= self.flush_bytes:
+                self._cond.notify_all()
+    
+    def close(self) -> dict:
+        """Flush everything still pending and return {path: success}."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+        return self.results
+    
+    def _run(self):
+        """Drain pending writes until closed."""
+        while True:
+            with self._cond:
+                if not self._closed and self._pending_bytes < self.flush_bytes:
+                    self._cond.wait(self.flush_interval)
+                batch = self._pending
+                self._pending = collections.deque()
+                self._pending_bytes = 0
+                closed = self._closed
+                self._cond.notify_all()
+            
+            for path, data in batch:
+                try:
+                    with open(path, 'wb', buffering=0) as f:
+                        f.write(data)
+                    self.results[path] = True
+                except Exception as e:
+                    # Record any failure so one bad item cannot stop the flusher
+                    logging.getLogger(__name__).error(f"Error writing {path}: {e}")
+                    self.results[path] = False
+            
+            if closed:
+                break
+
+
 def check_system_requirements() -> dict:
     """Check system requirements for DJZ-Speak."""
     requirements = {
@@ -199,9 +317,7 @@ def get_default_output_path(text: str, format: str = 'wav') -> str:
 
 def generate_timestamped_filename(text: str = None, format: str = 'wav') -> str:
     """Generate timestamped filename for audio output."""
-    from datetime import datetime
-    
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = datetime.now().strftime(_TIMESTAMP_FORMAT)
     
     if text:
         # Use first few words from text
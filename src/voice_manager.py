@@ -2,12 +2,164 @@
 Voice management system for DJZ-Speak
 """
 
+import copy
 import json
 import logging
+import os
+import sys
+from collections import ChainMap
+from dataclasses import dataclass
+from types import MappingProxyType
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from src.config_manager import ConfigManager
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Presets used when the bundled presets file cannot be loaded
+_FALLBACK_PRESETS = MappingProxyType({
+    'classic_robot': {
+        'name': 'Classic Robot',
+        'description': 'Standard computer robot voice',
+        'espeak_voice': 'en',
+        'speed': 140,
+        'pitch': 35,
+        'amplitude': 100,
+        'gap': 8,
+        'variant': 'm3',
+        'effects': {
+            'frequency_filter': True,
+            'harmonic_enhancement': 1.1,
+            'mechanical_artifacts': True
+        }
+    }
+})
+
+# Base parameters for custom voices created without a base voice
+_FALLBACK_BASE = MappingProxyType({
+    'espeak_voice': 'en',
+    'speed': 140,
+    'pitch': 35,
+    'amplitude': 100,
+    'gap': 8,
+    'variant': 'm3',
+    'effects': {
+        'frequency_filter': True,
+        'harmonic_enhancement': 1.1,
+        'mechanical_artifacts': True
+    }
+})
+
+# Categories reported by get_voice_categories, in display order
+_CATEGORY_NAMES = ('retro', 'cinematic', 'modern', 'experimental', 'custom')
+
+
+def _valid_speed(value: Any) -> bool:
+    """Speed in words per minute (80-300)."""
+    return isinstance(value, int) and 80 <= value <= 300
+
+
+def _valid_pitch(value: Any) -> bool:
+    """Pitch level (0-99)."""
+    return isinstance(value, int) and 0 <= value <= 99
+
+
+def _valid_amplitude(value: Any) -> bool:
+    """Amplitude level (0-200)."""
+    return isinstance(value, int) and 0 <= value <= 200
+
+
+def _valid_gap(value: Any) -> bool:
+    """Word gap in 10ms units (0-100)."""
+    return isinstance(value, int) and 0 <= value <= 100
+
+
+def _valid_espeak_voice(value: Any) -> bool:
+    """Non-empty eSpeak-NG voice name."""
+    return isinstance(value, str) and len(value) > 0
+
+
+def _valid_variant(value: Any) -> bool:
+    """eSpeak-NG voice variant name."""
+    return isinstance(value, str)
+
+
+# Validation rules for known voice parameters
+_VALIDATORS = {
+    'speed': _valid_speed,
+    'pitch': _valid_pitch,
+    'amplitude': _valid_amplitude,
+    'gap': _valid_gap,
+    'espeak_voice': _valid_espeak_voice,
+    'variant': _valid_variant,
+}
+
+
+def _valid_any(value: Any) -> bool:
+    """Any value; unknown parameters are allowed."""
+    return True
+
+
+def _validate_all(parameters: Dict[str, Any]) -> bool:
+    """Validate a dict of voice parameters against _VALIDATORS."""
+    return all(_VALIDATORS.get(key, _valid_any)(value) for key, value in parameters.items())
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to indented JSON bytes, with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+@dataclass(frozen=True)
+class VoiceInfo:
+    """Descriptive view of a voice preset, built once when the preset is added."""
+    # Declared by hand; dataclass(slots=True) needs Python 3.10
+    __slots__ = ('id', 'name', 'description', 'characteristics', 'speed', 'pitch',
+                 'amplitude', 'gap', 'espeak_voice', 'variant', 'effects')
+    
+    id: str
+    name: str
+    description: str
+    characteristics: str
+    speed: int
+    pitch: int
+    amplitude: int
+    gap: int
+    espeak_voice: str
+    variant: str
+    effects: Dict[str, Any]
+    
+    @classmethod
+    def from_config(cls, voice_id: str, config: Dict[str, Any]) -> 'VoiceInfo':
+        """Build a voice info from a preset configuration."""
+        return cls(
+            id=voice_id,
+            name=config.get('name', voice_id),
+            description=config.get('description', 'No description'),
+            characteristics=config.get('characteristics', 'Standard robotic voice'),
+            speed=config.get('speed', 140),
+            pitch=config.get('pitch', 35),
+            amplitude=config.get('amplitude', 100),
+            gap=config.get('gap', 8),
+            espeak_voice=config.get('espeak_voice', 'en'),
+            variant=config.get('variant', 'm3'),
+            effects=config.get('effects', {})
+        )
+
 
 class VoiceManager:
     """Manages voice presets and voice parameter configuration."""
@@ -16,9 +168,24 @@ class VoiceManager:
         """Initialize voice manager."""
         self.logger = logging.getLogger(__name__)
         self.config_manager = config_manager
+        # Presets by source; voice_presets is rebuilt from these, later sources winning
+        self._default_presets = {}
+        self._default_categories = {}
+        self._default_source = 'default'
+        self._user_presets = {}
+        self._user_categories = {}
+        self._custom_presets = {}
         self.voice_presets = {}
+        self._voice_infos = {}
+        # Reverse index: voice id -> the reported categories it belongs to
+        self._voice_to_category = {}
+        # The user presets file is only read once a user or custom voice is needed
+        self._user_loaded = False
         self.current_voice = None
+        # Per-session parameter overrides, layered over the current preset
+        self._overrides = {}
         self.current_parameters = {}
+        self._espeak_parameters = None
         
         # Load voice presets
         self._load_voice_presets()
@@ -29,80 +196,122 @@ class VoiceManager:
     
     def _load_voice_presets(self):
         """Load voice presets from configuration files."""
-        # Load default voice presets
+        # Load default voice presets; user presets are loaded on first use
         default_presets_path = self.config_manager.get_voice_presets_path()
-        self._load_presets_file(default_presets_path, is_default=True)
+        try:
+            stat = os.stat(default_presets_path)
+        except OSError:
+            stat = None
+        
+        data = None
+        if stat is None:
+            self.logger.warning(f"Default voice presets file not found: {default_presets_path}")
+        else:
+            data = self._read_presets_file(default_presets_path)
+        
+        if data is None:
+            self._create_fallback_presets()
+        else:
+            self._default_presets, self._default_categories = data
+        
+        self._rebuild_presets()
+    
+    def _ensure_user_loaded(self):
+        """Load the user presets file on first use."""
+        if self._user_loaded:
+            return
+        self._user_loaded = True
         
-        # Load user voice presets
         user_presets_path = self.config_manager.get_user_presets_path()
-        if user_presets_path.exists():
-            self._load_presets_file(user_presets_path, is_default=False)
+        try:
+            os.stat(user_presets_path)
+        except OSError:
+            return
+        
+        data = self._read_presets_file(user_presets_path)
+        if data is None:
+            return
+        self._user_presets, self._user_categories = data
+        self._rebuild_presets()
+        
+        # A bundled current voice may have been selected before its user override was loaded
+        if self.current_voice in self._user_presets:
+            self.current_parameters.maps[1] = self.voice_presets[self.current_voice]
+            self._espeak_parameters = None
     
-    def _load_presets_file(self, file_path: Path, is_default: bool = False):
-        """Load voice presets from a JSON file."""
+    def _read_presets_file(self, file_path: Path):
+        """Read (voices, voice_categories) from a JSON presets file, or None on error."""
         try:
-            if not file_path.exists():
-                if is_default:
-                    self.logger.warning(f"Default voice presets file not found: {file_path}")
-                    self._create_fallback_presets()
-                return
-            
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            voices = data.get('voices', {})
-            for voice_id, voice_config in voices.items():
-                self.voice_presets[voice_id] = voice_config
-                voice_config['_source'] = 'default' if is_default else 'user'
-            
+            data = _json_loads(file_path.read_bytes())
+            voices = {sys.intern(voice_id): config for voice_id, config in data.get('voices', {}).items()}
             self.logger.debug(f"Loaded {len(voices)} voice presets from {file_path}")
-            
+            return voices, data.get('voice_categories', {})
         except Exception as e:
             self.logger.error(f"Error loading voice presets from {file_path}: {e}")
-            if is_default:
-                self._create_fallback_presets()
+            return None
     
     def _create_fallback_presets(self):
         """Create fallback voice presets if loading fails."""
-        self.voice_presets = {
-            'classic_robot': {
-                'name': 'Classic Robot',
-                'description': 'Standard computer robot voice',
-                'espeak_voice': 'en',
-                'speed': 140,
-                'pitch': 35,
-                'amplitude': 100,
-                'gap': 8,
-                'variant': 'm3',
-                'effects': {
-                    'frequency_filter': True,
-                    'harmonic_enhancement': 1.1,
-                    'mechanical_artifacts': True
-                },
-                '_source': 'fallback'
-            }
-        }
+        self._default_presets = copy.deepcopy(dict(_FALLBACK_PRESETS))
+        self._default_categories = {}
+        self._default_source = 'fallback'
         self.logger.warning("Using fallback voice presets")
     
+    def _rebuild_presets(self):
+        """Rebuild the merged presets and their indexes from each source."""
+        self.voice_presets = {**self._default_presets, **self._user_presets, **self._custom_presets}
+        self._voice_infos = {
+            voice_id: VoiceInfo.from_config(voice_id, config)
+            for voice_id, config in self.voice_presets.items()
+        }
+        
+        self._voice_to_category = {}
+        for categories in (self._default_categories, self._user_categories):
+            for category, category_voices in categories.items():
+                if category in _CATEGORY_NAMES:
+                    for voice_id in category_voices:
+                        self._voice_to_category.setdefault(voice_id, []).append(category)
+        for voice_id in self._custom_presets:
+            self._voice_to_category[voice_id] = ['custom']
+    
+    def _voice_source(self, voice_id: str) -> str:
+        """Get where a voice preset came from."""
+        if voice_id in self._custom_presets:
+            return 'custom'
+        if voice_id in self._user_presets:
+            return 'user'
+        if voice_id in self._default_presets:
+            return self._default_source
+        return 'unknown'
+    
     def list_voices(self) -> List[str]:
         """Get list of available voice preset names."""
-        return list(self.voice_presets.keys())
+        self._ensure_user_loaded()
+        
+        return list(self.voice_presets)
     
     def get_voice(self, voice_id: str) -> Optional[Dict[str, Any]]:
         """Get voice preset configuration."""
+        self._ensure_user_loaded()
+        
         return self.voice_presets.get(voice_id)
     
     def set_voice(self, voice_id: str) -> bool:
         """Set current voice preset."""
-        if voice_id not in self.voice_presets:
+        # Bundled voices need no user presets, which keeps the file off the
+        # startup path; _ensure_user_loaded applies any override later
+        if voice_id not in self._default_presets:
+            self._ensure_user_loaded()
+        
+        config = self.voice_presets.get(voice_id)
+        if config is None:
             self.logger.warning(f"Voice preset '{voice_id}' not found")
             return False
         
         self.current_voice = voice_id
-        self.current_parameters = self.voice_presets[voice_id].copy()
-        
-        # Remove metadata
-        self.current_parameters.pop('_source', None)
+        self._overrides = {}
+        self.current_parameters = ChainMap(self._overrides, config)
+        self._espeak_parameters = None
         
         self.logger.debug(f"Set voice to: {voice_id}")
         return True
@@ -112,10 +321,9 @@ class VoiceManager:
         if self.current_voice is None:
             return {}
         
-        return {
-            'id': self.current_voice,
-            **self.current_parameters
-        }
+        self._ensure_user_loaded()
+        
+        return {'id': self.current_voice, **self.current_parameters}
     
     def get_current_voice_name(self) -> str:
         """Get current voice preset name."""
@@ -133,99 +341,99 @@ class VoiceManager:
         if not self._validate_parameter(parameter, value):
             return False
         
-        self.current_parameters[parameter] = value
+        self._overrides[parameter] = value
+        self._espeak_parameters = None
         self.logger.debug(f"Updated {parameter} to {value} for voice {self.current_voice}")
         return True
     
     def _validate_parameter(self, parameter: str, value: Any) -> bool:
         """Validate voice parameter value."""
-        validation_rules = {
-            'speed': lambda x: isinstance(x, int) and 80 <= x <= 300,
-            'pitch': lambda x: isinstance(x, int) and 0 <= x <= 99,
-            'amplitude': lambda x: isinstance(x, int) and 0 <= x <= 200,
-            'gap': lambda x: isinstance(x, int) and 0 <= x <= 100,
-            'espeak_voice': lambda x: isinstance(x, str) and len(x) > 0,
-            'variant': lambda x: isinstance(x, str),
-        }
-        
-        if parameter in validation_rules:
-            return validation_rules[parameter](value)
+        validator = _VALIDATORS.get(parameter)
+        if validator is None:
+            return True  # Allow unknown parameters
         
-        return True  # Allow unknown parameters
+        return validator(value)
     
     def get_espeak_parameters(self) -> Dict[str, Any]:
-        """Get eSpeak-NG specific parameters from current voice."""
+        """Get eSpeak-NG specific parameters from current voice.
+        
+        The returned dict is cached until the voice or a parameter changes;
+        callers must not modify it.
+        """
         if not self.current_parameters:
             return {}
         
-        return {
-            'voice': self.current_parameters.get('espeak_voice', 'en'),
-            'speed': self.current_parameters.get('speed', 140),
-            'pitch': self.current_parameters.get('pitch', 35),
-            'amplitude': self.current_parameters.get('amplitude', 100),
-            'gap': self.current_parameters.get('gap', 8),
-            'variant': self.current_parameters.get('variant', 'm3')
-        }
+        if self._espeak_parameters is None:
+            # The current voice's user override, if any, must be in place
+            # before its parameters are first used
+            self._ensure_user_loaded()
+            self._espeak_parameters = {
+                'voice': self.current_parameters.get('espeak_voice', 'en'),
+                'speed': self.current_parameters.get('speed', 140),
+                'pitch': self.current_parameters.get('pitch', 35),
+                'amplitude': self.current_parameters.get('amplitude', 100),
+                'gap': self.current_parameters.get('gap', 8),
+                'variant': self.current_parameters.get('variant', 'm3')
+            }
+        
+        return self._espeak_parameters
     
     def get_effects_parameters(self) -> Dict[str, Any]:
         """Get audio effects parameters from current voice."""
         if not self.current_parameters:
             return {}
         
+        self._ensure_user_loaded()
+        
         return self.current_parameters.get('effects', {})
     
     def create_custom_voice(self, voice_id: str, name: str, base_voice: str = None, **parameters) -> bool:
         """Create a custom voice preset."""
+        self._ensure_user_loaded()
+        
         if voice_id in self.voice_presets:
             self.logger.warning(f"Voice preset '{voice_id}' already exists")
             return False
         
-        # Start with base voice if specified
-        if base_voice and base_voice in self.voice_presets:
-            voice_config = self.voice_presets[base_voice].copy()
-            voice_config.pop('_source', None)
-        else:
-            voice_config = {
-                'espeak_voice': 'en',
-                'speed': 140,
-                'pitch': 35,
-                'amplitude': 100,
-                'gap': 8,
-                'variant': 'm3',
-                'effects': {
-                    'frequency_filter': True,
-                    'harmonic_enhancement': 1.1,
-                    'mechanical_artifacts': True
-                }
-            }
-        
-        # Update with custom parameters
-        voice_config['name'] = name
-        voice_config['description'] = f"Custom voice: {name}"
-        voice_config.update(parameters)
-        voice_config['_source'] = 'custom'
-        
         # Validate parameters
-        for param, value in parameters.items():
-            if not self._validate_parameter(param, value):
-                self.logger.error(f"Invalid parameter {param}={value} for custom voice")
-                return False
+        if not _validate_all(parameters):
+            self.logger.error(f"Invalid parameters for custom voice: {parameters}")
+            return False
         
+        # Start with base voice if specified; custom parameters win over everything.
+        # The fallback is deep-copied so no voice shares its nested effects dict
+        base = self.voice_presets.get(base_voice)
+        if base is None:
+            base = copy.deepcopy(dict(_FALLBACK_BASE))
+        voice_config = {
+            **base,
+            'name': name,
+            'description': f"Custom voice: {name}",
+            **parameters
+        }
+        
+        voice_id = sys.intern(voice_id)
+        self._custom_presets[voice_id] = voice_config
         self.voice_presets[voice_id] = voice_config
+        self._voice_infos[voice_id] = VoiceInfo.from_config(voice_id, voice_config)
+        self._voice_to_category[voice_id] = ['custom']
         self.logger.info(f"Created custom voice: {voice_id}")
         return True
     
     def delete_voice(self, voice_id: str) -> bool:
         """Delete a voice preset (only custom voices)."""
+        self._ensure_user_loaded()
+        
         if voice_id not in self.voice_presets:
             return False
         
-        voice_config = self.voice_presets[voice_id]
-        if voice_config.get('_source') not in ['custom', 'user']:
+        if voice_id not in self._custom_presets and voice_id not in self._user_presets:
             self.logger.warning(f"Cannot delete default voice preset: {voice_id}")
             return False
         
-        del self.voice_presets[voice_id]
+        self._custom_presets.pop(voice_id, None)
+        self._user_presets.pop(voice_id, None)
+        self._rebuild_presets()
         
         # If this was the current voice, switch to default
         if self.current_voice == voice_id:
@@ -236,27 +444,21 @@ class VoiceManager:
     
     def save_user_presets(self):
         """Save user and custom voice presets to user config file."""
+        self._ensure_user_loaded()
+        
         try:
             user_presets_path = self.config_manager.get_user_presets_path()
             user_presets_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Filter user and custom voices
-            user_voices = {
-                voice_id: config for voice_id, config in self.voice_presets.items()
-                if config.get('_source') in ['user', 'custom']
-            }
-            
-            # Remove source metadata for saving
+            # Keep user and custom voices in one pass
             clean_voices = {}
-            for voice_id, config in user_voices.items():
-                clean_config = config.copy()
-                clean_config.pop('_source', None)
-                clean_voices[voice_id] = clean_config
+            for voice_id, config in self.voice_presets.items():
+                if voice_id in self._user_presets or voice_id in self._custom_presets:
+                    clean_voices[voice_id] = config
             
             data = {'voices': clean_voices}
             
-            with open(user_presets_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            user_presets_path.write_bytes(_json_dumps(data))
             
             self.logger.info(f"Saved {len(clean_voices)} user voice presets")
             
@@ -265,72 +467,50 @@ class VoiceManager:
     
     def get_voice_categories(self) -> Dict[str, List[str]]:
         """Get voice presets organized by categories."""
-        categories = {
-            'retro': [],
-            'cinematic': [],
-            'modern': [],
-            'experimental': [],
-            'custom': []
-        }
-        
-        # Load categories from default presets file if available
-        try:
-            default_presets_path = self.config_manager.get_voice_presets_path()
-            if default_presets_path.exists():
-                with open(default_presets_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                preset_categories = data.get('voice_categories', {})
-                for category, voices in preset_categories.items():
-                    if category in categories:
-                        categories[category].extend(voices)
-        except Exception as e:
-            self.logger.debug(f"Could not load voice categories: {e}")
+        self._ensure_user_loaded()
         
-        # Add custom voices
-        for voice_id, config in self.voice_presets.items():
-            if config.get('_source') == 'custom':
-                categories['custom'].append(voice_id)
+        categories = {category: [] for category in _CATEGORY_NAMES}
+        categories['other'] = []
         
-        # Add uncategorized voices
-        all_categorized = set()
-        for voice_list in categories.values():
-            all_categorized.update(voice_list)
-        
-        uncategorized = set(self.voice_presets.keys()) - all_categorized
-        if uncategorized:
-            categories['other'] = list(uncategorized)
+        # Uncategorized voices go under 'other'
+        for voice_id in self.voice_presets:
+            for category in self._voice_to_category.get(voice_id, ('other',)):
+                categories[category].append(voice_id)
         
         # Remove empty categories
         return {cat: voices for cat, voices in categories.items() if voices}
     
     def get_voice_info(self, voice_id: str) -> Dict[str, Any]:
         """Get detailed information about a voice preset."""
-        if voice_id not in self.voice_presets:
-            return {}
+        self._ensure_user_loaded()
         
-        config = self.voice_presets[voice_id]
+        info = self._voice_infos.get(voice_id)
+        if info is None:
+            return {}
         
         return {
-            'id': voice_id,
-            'name': config.get('name', voice_id),
-            'description': config.get('description', 'No description'),
-            'characteristics': config.get('characteristics', 'Standard robotic voice'),
-            'source': config.get('_source', 'unknown'),
+            'id': info.id,
+            'name': info.name,
+            'description': info.description,
+            'characteristics': info.characteristics,
+            'source': self._voice_source(voice_id),
             'parameters': {
-                'speed': config.get('speed', 140),
-                'pitch': config.get('pitch', 35),
-                'amplitude': config.get('amplitude', 100),
-                'gap': config.get('gap', 8),
-                'espeak_voice': config.get('espeak_voice', 'en'),
-                'variant': config.get('variant', 'm3')
+                'speed': info.speed,
+                'pitch': info.pitch,
+                'amplitude': info.amplitude,
+                'gap': info.gap,
+                'espeak_voice': info.espeak_voice,
+                'variant': info.variant
             },
-            'effects': config.get('effects', {})
+            'effects': info.effects
         }
     
     def clone_voice(self, source_voice_id: str, new_voice_id: str, new_name: str) -> bool:
         """Clone an existing voice preset."""
-        if source_voice_id not in self.voice_presets:
+        self._ensure_user_loaded()
+        
+        source = self.voice_presets.get(source_voice_id)
+        if source is None:
             self.logger.error(f"Source voice '{source_voice_id}' not found")
             return False
         
@@ -339,19 +519,21 @@ class VoiceManager:
             return False
         
         # Clone the voice configuration
-        source_config = self.voice_presets[source_voice_id].copy()
-        source_config.pop('_source', None)
+        source_config = source.copy()
         source_config['name'] = new_name
         source_config['description'] = f"Clone of {source_config.get('name', source_voice_id)}"
-        source_config['_source'] = 'custom'
         
+        new_voice_id = sys.intern(new_voice_id)
+        self._custom_presets[new_voice_id] = source_config
         self.voice_presets[new_voice_id] = source_config
+        self._voice_infos[new_voice_id] = VoiceInfo.from_config(new_voice_id, source_config)
+        self._voice_to_category[new_voice_id] = ['custom']
         self.logger.info(f"Cloned voice '{source_voice_id}' to '{new_voice_id}'")
         return True
     
     def reset_voice_parameters(self):
         """Reset current voice to its preset defaults."""
         if self.current_voice:
-            self.current_parameters = self.voice_presets[self.current_voice].copy()
-            self.current_parameters.pop('_source', None)
+            self._overrides.clear()
+            self._espeak_parameters = None
             self.logger.debug(f"Reset voice parameters for {self.current_voice}")
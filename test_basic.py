@@ -3,8 +3,11 @@
 Basic functionality test for DJZ-Speak
 """
 
+import contextlib
+import io
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Add src to path for imports
@@ -117,6 +120,17 @@ def test_audio_processor():
         print(f"✗ Audio processor error: {e}")
         return False
 
+def run_captured(test):
+    """Run a test in a worker process, returning its result and printed output."""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        try:
+            result = test()
+        except Exception as e:
+            print(f"✗ Test failed with exception: {e}")
+            result = False
+    return result, output.getvalue()
+
 def main():
     """Run basic tests."""
     print("DJZ-Speak Basic Functionality Test")
@@ -133,14 +147,14 @@ def main():
     passed = 0
     total = len(tests)
     
-    for test in tests:
-        try:
-            if test():
+    # The tests are independent, so run them side by side; each one's output
+    # is captured in its worker and printed with its result, in test order
+    with ProcessPoolExecutor(max_workers=total) as executor:
+        for result, output in executor.map(run_captured, tests):
+            print(output, end='')
+            if result:
                 passed += 1
             print()
-        except Exception as e:
-            print(f"✗ Test failed with exception: {e}")
-            print()
     
     print("=" * 40)
     print(f"Tests passed: {passed}/{total}")
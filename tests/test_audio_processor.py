@@ -0,0 +1,158 @@
+"""
+Parity tests for the NumPy audio effects against pydub's implementations
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+pydub = pytest.importorskip("pydub")
+from pydub import AudioSegment
+
+from src.config_manager import ConfigManager
+from src.audio_processor import AudioProcessor, _SAMPLE_DTYPES
+
+WIDTHS = (1, 2, 4)
+
+
+@pytest.fixture(scope="module")
+def processor():
+    return AudioProcessor(ConfigManager())
+
+
+def make_segment(sample_width, channels=1, frame_rate=22050, seconds=1.0, level=1 / 6, seed=0):
+    """Gaussian noise at a fraction of full scale."""
+    info = np.iinfo(_SAMPLE_DTYPES[sample_width])
+    count = int(frame_rate * seconds) * channels
+    noise = np.random.default_rng(seed).standard_normal(count) * info.max * level
+    samples = np.clip(noise, info.min, info.max).astype(info.dtype)
+    return AudioSegment(samples.tobytes(), sample_width=sample_width, frame_rate=frame_rate, channels=channels)
+
+
+def samples_of(audio):
+    return np.frombuffer(audio.raw_data, dtype=_SAMPLE_DTYPES[audio.sample_width]).astype(np.int64)
+
+
+def assert_same_audio(expected, actual):
+    assert actual.sample_width == expected.sample_width
+    assert actual.channels == expected.channels
+    assert actual.frame_rate == expected.frame_rate
+    np.testing.assert_array_equal(samples_of(actual), samples_of(expected))
+
+
+@pytest.mark.parametrize("sample_width", WIDTHS)
+@pytest.mark.parametrize("channels", (1, 2))
+@pytest.mark.parametrize("target", (-20.0, -3.0, 0.0))
+def test_normalize_matches_pydub(processor, sample_width, channels, target):
+    audio = make_segment(sample_width, channels)
+    expected = audio + (target - audio.dBFS)
+    assert_same_audio(expected, processor.normalize_audio(audio, target))
+
+
+@pytest.mark.parametrize("sample_width", WIDTHS)
+def test_normalize_full_scale_does_not_wrap(processor, sample_width):
+    info = np.iinfo(_SAMPLE_DTYPES[sample_width])
+    sine = np.round(np.sin(np.arange(22050) / 7.0) * info.max).astype(info.dtype)
+    audio = AudioSegment(sine.tobytes(), sample_width=sample_width, frame_rate=22050, channels=1)
+
+    normalized = samples_of(processor.normalize_audio(audio, 0.0))
+    assert normalized.max() == info.max
+    assert normalized.min() == info.min
+    assert_same_audio(audio + (0.0 - audio.dBFS), processor.normalize_audio(audio, 0.0))
+
+
+@pytest.mark.parametrize("sample_width", WIDTHS)
+@pytest.mark.parametrize("channels", (1, 2))
+@pytest.mark.parametrize("frame_rate", (16000, 22050, 44100))
+def test_reverb_matches_pydub(processor, sample_width, channels, frame_rate):
+    audio = make_segment(sample_width, channels, frame_rate)
+    room_size, damping = 0.3, 0.5
+    delayed = AudioSegment.silent(duration=int(room_size * 100)) + audio
+    expected = audio.overlay(delayed - (20 * damping))
+    assert_same_audio(expected, processor.add_reverb(audio, room_size, damping))
+
+
+def speech_with_pauses(sample_width, channels, seed):
+    """Alternating bursts of noise and near-silence of random lengths."""
+    rng = np.random.default_rng(seed)
+    info = np.iinfo(_SAMPLE_DTYPES[sample_width])
+    parts = []
+    for index in range(6):
+        frames = int(rng.integers(100, 3000)) * 22
+        level = info.max / 4 if index % 2 else rng.choice([0, 1e-5, 0.02]) * info.max
+        parts.append(np.clip(rng.standard_normal(frames * channels) * level, info.min, info.max).astype(info.dtype))
+    samples = np.concatenate(parts)
+    return AudioSegment(samples.tobytes(), sample_width=sample_width, frame_rate=22050, channels=channels)
+
+
+# 32-bit audio is handed to pydub as is, so only the NumPy widths are compared
+@pytest.mark.parametrize("sample_width", (1, 2))
+@pytest.mark.parametrize("channels", (1, 2))
+@pytest.mark.parametrize("seed", range(2))
+def test_trim_silence_matches_strip_silence(processor, sample_width, channels, seed):
+    audio = speech_with_pauses(sample_width, channels, seed)
+    expected = audio.strip_silence(silence_len=1000, silence_thresh=-50.0, padding=100)
+    assert_same_audio(expected, processor.trim_silence(audio, -50.0))
+
+
+@pytest.mark.parametrize("silence_thresh", (-50.0, -30.0, -20.0))
+def test_trim_silence_matches_strip_silence_on_speech(processor, silence_thresh):
+    audio = AudioSegment.from_wav(str(Path(__file__).parent.parent / "robot.wav"))
+    expected = audio.strip_silence(silence_len=1000, silence_thresh=silence_thresh, padding=100)
+    assert_same_audio(expected, processor.trim_silence(audio, silence_thresh))
+
+
+def enhance_reference(samples, factor):
+    """The original per-channel float64 soft-clipping."""
+    max_val = np.max(np.abs(samples))
+    if max_val > 0:
+        return (np.tanh(samples / max_val * factor) * max_val * 0.8).astype(samples.dtype)
+    return samples
+
+
+@pytest.mark.parametrize("sample_width", WIDTHS)
+@pytest.mark.parametrize("channels", (1, 2))
+def test_harmonic_enhancement_matches_reference(processor, sample_width, channels):
+    audio = make_segment(sample_width, channels)
+    samples = np.array(audio.get_array_of_samples()).reshape(-1, channels)
+    expected = np.stack([enhance_reference(samples[:, c].copy(), 1.3) for c in range(channels)], axis=1)
+
+    enhanced = samples_of(processor._apply_harmonic_enhancement(audio, 1.3))
+    # The compiled kernel's tanh may differ from NumPy's in the last ulp
+    assert np.abs(enhanced - expected.reshape(-1)).max() <= 1
+
+
+@pytest.mark.parametrize("sample_width", WIDTHS)
+@pytest.mark.parametrize("channels", (1, 2))
+def test_mechanical_artifacts_match_pydub(processor, sample_width, channels):
+    audio = make_segment(sample_width, channels)
+    crushed = audio.set_sample_width(1).set_sample_width(sample_width)
+    expected = audio.overlay(crushed - 20)
+    assert_same_audio(expected, processor._apply_mechanical_artifacts(audio))
+
+
+
+def test_kernel_warm_up_covers_the_effects_chain():
+    pytest.importorskip("numba")
+    # A fresh interpreter, so kernels compiled by other tests do not count
+    script = """
+from src.audio_kernels import enhance_kernel, mechanical_artifacts_kernel
+from src.config_manager import ConfigManager
+from src.audio_processor import AudioProcessor
+config = ConfigManager()
+config.set('effects', 'enable_by_default', True)
+processor = AudioProcessor(config)
+print([str(sig[0]) for sig in enhance_kernel.signatures])
+print([str(sig[0]) for sig in mechanical_artifacts_kernel.signatures])
+"""
+    result = subprocess.run([sys.executable, '-c', script], cwd=PROJECT_ROOT,
+                            capture_output=True, text=True, timeout=120)
+    enhance, mechanical = result.stdout.splitlines()[-2:]
+    assert enhance == "['array(float64, 2d, C)']"
+    assert mechanical == "['array(int16, 1d, C)']"
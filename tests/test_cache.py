@@ -0,0 +1,100 @@
+"""
+Tests for the on-disk synthesis cache and its pruning
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import main
+from src.config_manager import ConfigManager
+from src.espeak_library import find_library
+
+MB = 1024 * 1024
+
+
+@pytest.fixture
+def config(tmp_path):
+    config = ConfigManager()
+    config.set('paths', 'cache_directory', str(tmp_path / "cache"))
+    config.set('performance', 'cache_size', 1)
+    return config
+
+
+@pytest.fixture
+def engine(config):
+    if find_library() is None:
+        pytest.skip("libespeak-ng not available")
+    from src.voice_manager import VoiceManager
+    from src.tts_engine import TTSEngine
+    return TTSEngine(config, VoiceManager(config))
+
+
+def fill_cache(cache_dir, count, size):
+    """Write count entries of size bytes, oldest first."""
+    paths = []
+    for i in range(count):
+        path = cache_dir / f"{i:032x}.wav"
+        path.write_bytes(b'\0' * size)
+        os.utime(path, (1_000_000 + i, 1_000_000 + i))
+        paths.append(path)
+    return paths
+
+
+def test_store_and_load_round_trip(config):
+    path = config.get_cache_directory() / "entry.wav"
+    assert main._cache_load(path) is None
+
+    main._cache_store(path, b'RIFF data')
+    os.utime(path, (1_000_000, 1_000_000))
+    assert main._cache_load(path) == b'RIFF data'
+    # Loading marks the entry as recently used
+    assert path.stat().st_mtime > 1_000_000
+    assert list(path.parent.glob("*.tmp")) == []
+
+
+def test_synthesize_cached_hits_on_repeat(engine):
+    audio_data, hit = main._synthesize_cached(engine, "Cache this phrase.")
+    assert audio_data and hit is None
+
+    cached, hit = main._synthesize_cached(engine, "Cache this phrase.")
+    assert cached == audio_data
+    assert hit == main._cache_path(engine, "Cache this phrase.")
+
+
+def test_cache_key_depends_on_voice(engine):
+    before = main._cache_path(engine, "Same text.")
+    engine.set_speed(engine.current_speed + 10)
+    assert main._cache_path(engine, "Same text.") != before
+
+    params = dict(engine.voice_manager.get_espeak_parameters())
+    assert main._cache_path(engine, "Same text.", params) == main._cache_path(engine, "Same text.")
+
+
+def test_prune_evicts_least_recently_used(config):
+    paths = fill_cache(config.get_cache_directory(), 4, 400 * 1024)
+    main._prune_cache(config, force=True)
+    assert [path.exists() for path in paths] == [False, False, True, True]
+
+
+def test_prune_leaves_cache_under_limit_alone(config):
+    paths = fill_cache(config.get_cache_directory(), 2, 400 * 1024)
+    main._prune_cache(config, force=True)
+    assert all(path.exists() for path in paths)
+
+
+def test_prune_runs_at_most_once_per_interval(config):
+    cache_dir = config.get_cache_directory()
+    main._prune_cache(config)
+
+    paths = fill_cache(cache_dir, 4, 400 * 1024)
+    main._prune_cache(config)
+    assert all(path.exists() for path in paths)
+
+    config.set('performance', 'cache_prune_interval', 0)
+    main._prune_cache(config)
+    assert sum(path.exists() for path in paths) == 2
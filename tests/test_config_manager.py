@@ -0,0 +1,57 @@
+"""
+Tests for configuration lookups and directory handling
+"""
+
+import shutil
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config_manager import ConfigManager
+
+
+def test_get_and_set_round_trip():
+    config = ConfigManager()
+    config.set('synthesis', 'speed', 175)
+    assert config.get('synthesis', 'speed') == 175
+    assert config.get('synthesis', 'no_such_key', 'fallback') == 'fallback'
+
+
+def test_environment_overrides_are_coerced(monkeypatch):
+    monkeypatch.setenv('DJZ_SPEAK_SPEED', '222')
+    monkeypatch.setenv('DJZ_SPEAK_VOICE', 'glados')
+    config = ConfigManager()
+    assert config.get('synthesis', 'speed') == 222
+    assert config.get('synthesis', 'voice') == 'glados'
+
+
+def test_cache_directory_is_recreated_after_removal(tmp_path):
+    config = ConfigManager()
+    config.set('paths', 'cache_directory', str(tmp_path / "cache"))
+
+    cache_dir = config.get_cache_directory()
+    assert cache_dir.is_dir()
+
+    shutil.rmtree(cache_dir)
+    assert config.get_cache_directory() == cache_dir
+    assert cache_dir.is_dir()
+
+
+def test_output_directory_is_recreated_after_removal(tmp_path):
+    config = ConfigManager()
+    config.set('output', 'default_output_directory', str(tmp_path / "out"))
+
+    output_dir = config.get_default_output_directory()
+    assert output_dir.is_dir()
+
+    output_dir.rmdir()
+    assert config.get_default_output_directory().is_dir()
+
+
+def test_section_accessors_return_copies():
+    config = ConfigManager()
+    params = config.get_synthesis_params()
+    params['speed'] = 299
+    assert config.get('synthesis', 'speed') != 299
+    assert config.get_synthesis_params()['speed'] == config.get('synthesis', 'speed')
@@ -0,0 +1,157 @@
+"""
+Tests for the warm synthesis daemon: protocol, config keying and idle shutdown
+"""
+
+import json
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import daemon
+from src.config_manager import ConfigManager
+from src.espeak_library import find_library
+
+if find_library() is None:
+    pytest.skip("libespeak-ng not available", allow_module_level=True)
+
+PROJECT_ROOT = Path(__file__).parent.parent
+SETTINGS = PROJECT_ROOT / "config" / "settings.yaml"
+
+# Runs the CLI and reports which heavy modules it imported
+CLIENT_SCRIPT = """
+import runpy, sys
+sys.argv = ['main.py'] + sys.argv[1:]
+try:
+    runpy.run_path('main.py', run_name='__main__')
+except SystemExit:
+    pass
+print('IMPORTED', sorted(m for m in ('scipy.signal', 'numba') if m in sys.modules))
+"""
+
+
+def write_config(tmp_path, idle_timeout):
+    config = yaml.safe_load(SETTINGS.read_text(encoding='utf-8'))
+    config['paths']['cache_directory'] = str(tmp_path / "cache")
+    config['performance']['daemon_idle_timeout'] = idle_timeout
+    config_file = tmp_path / "settings.yaml"
+    config_file.write_text(yaml.safe_dump(config), encoding='utf-8')
+    return str(config_file)
+
+
+def start_daemon(config_file):
+    """Serve a daemon from a thread and wait until it accepts connections."""
+    config_manager = ConfigManager(config_file)
+    thread = threading.Thread(target=daemon.serve, args=(config_file,), daemon=True)
+    thread.start()
+
+    deadline = time.monotonic() + 10
+    while daemon._connect(config_manager) is None:
+        assert time.monotonic() < deadline, "daemon did not start"
+        time.sleep(0.02)
+
+    return config_manager, thread
+
+
+@pytest.fixture
+def running(tmp_path):
+    config_manager, thread = start_daemon(write_config(tmp_path, idle_timeout=0.5))
+    yield config_manager, thread
+    thread.join(timeout=10)
+
+
+def raw_request(config_manager, payload: bytes) -> bytes:
+    with daemon._connect(config_manager) as sock:
+        sock.settimeout(10)
+        daemon._send_message(sock, payload)
+        return daemon._recv_message(sock)
+
+
+def test_request_returns_wav(running):
+    config_manager, _ = running
+    audio_data = daemon.request_synthesis(config_manager, {'text': "Hello from the daemon.", 'voice': 'classic_robot'})
+    assert audio_data[:4] == b'RIFF'
+    assert len(audio_data) > 1000
+
+
+@pytest.mark.parametrize("payload", [b'not json', b'[1, 2]', b'{"text": 5}', b'{"voice": "x"}', b'\xff'])
+def test_bad_requests_get_an_empty_reply(running, payload):
+    config_manager, thread = running
+    assert raw_request(config_manager, payload) == b''
+
+    # The daemon keeps serving afterwards
+    assert thread.is_alive()
+    assert raw_request(config_manager, json.dumps({'text': "Still here."}).encode())[:4] == b'RIFF'
+
+
+def test_idle_daemon_shuts_down_and_removes_its_socket(running):
+    config_manager, thread = running
+    thread.join(timeout=10)
+    assert not thread.is_alive()
+    assert not daemon._address_path(config_manager).exists()
+    assert daemon._connect(config_manager) is None
+
+
+def test_address_depends_on_effective_config(tmp_path, monkeypatch):
+    config_file = write_config(tmp_path, idle_timeout=600)
+    address = daemon._address_path(ConfigManager(config_file))
+    assert daemon._address_path(ConfigManager(config_file)) == address
+
+    # An environment override changes the effective config
+    monkeypatch.setenv('DJZ_SPEAK_SPEED', '200')
+    overridden = daemon._address_path(ConfigManager(config_file))
+    monkeypatch.delenv('DJZ_SPEAK_SPEED')
+    assert overridden != address
+
+    # So does editing the config file
+    Path(config_file).write_text(Path(config_file).read_text().replace('600', '601'))
+    assert daemon._address_path(ConfigManager(config_file)) != address
+
+
+def test_stale_socket_file_is_replaced(tmp_path):
+    config_file = write_config(tmp_path, idle_timeout=0.2)
+    config_manager = ConfigManager(config_file)
+    stale = daemon._address_path(config_manager)
+    if daemon.USE_UNIX_SOCKET:
+        # A socket file nobody listens on, as left by a killed daemon
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.bind(str(stale))
+        sock.close()
+    assert daemon._connect(config_manager) is None
+
+    listener = daemon._create_listener(config_manager)
+    assert listener is not None
+    listener.close()
+
+
+def test_client_does_not_import_effect_dependencies(tmp_path):
+    config_file = write_config(tmp_path, idle_timeout=3)
+    _, thread = start_daemon(config_file)
+    output_file = tmp_path / "out.wav"
+
+    result = subprocess.run(
+        [sys.executable, '-c', CLIENT_SCRIPT, '--config', config_file, '--daemon', '--no-play',
+         '--output', str(output_file), "Hello from the client."],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=60
+    )
+    thread.join(timeout=10)
+
+    assert "daemon unavailable" not in result.stdout
+    assert "IMPORTED []" in result.stdout
+    assert output_file.read_bytes()[:4] == b'RIFF'
+
+
+def test_audio_processor_defers_effect_dependencies():
+    result = subprocess.run(
+        [sys.executable, '-c', "import sys; import src.audio_processor; "
+         "print(sorted(m for m in ('scipy.signal', 'numba') if m in sys.modules))"],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=60
+    )
+    assert result.stdout.strip() == "[]"
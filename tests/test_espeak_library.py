@@ -0,0 +1,59 @@
+"""
+Tests for in-process synthesis through libespeak-ng
+"""
+
+import io
+import sys
+import wave
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.espeak_library import ESPEAKNG_LOADER_AVAILABLE, _bundled_data_path, find_library, get_library
+
+if find_library() is None:
+    pytest.skip("libespeak-ng not available", allow_module_level=True)
+
+VOICE = {'voice': 'en', 'variant': 'm3', 'speed': 140, 'pitch': 35, 'amplitude': 100, 'gap': 8}
+
+
+@pytest.fixture(scope="module")
+def library():
+    return get_library()
+
+
+def read_wav(audio_data):
+    with wave.open(io.BytesIO(audio_data)) as wav:
+        return wav.getframerate(), wav.getsampwidth(), wav.getnchannels(), wav.getnframes()
+
+
+def test_library_is_shared(library):
+    assert get_library() is library
+
+
+def test_synthesize_returns_wav(library):
+    frame_rate, sample_width, channels, frames = read_wav(library.synthesize("Hello world.", VOICE))
+    assert frame_rate == library.sample_rate
+    assert (sample_width, channels) == (2, 1)
+    assert frames > frame_rate // 4
+
+
+def test_speed_changes_duration(library):
+    slow = read_wav(library.synthesize("The quick brown fox.", dict(VOICE, speed=80)))[3]
+    fast = read_wav(library.synthesize("The quick brown fox.", dict(VOICE, speed=300)))[3]
+    assert fast < slow
+
+
+def test_unknown_voice_fails_without_breaking_the_library(library):
+    assert library.synthesize("Hello.", dict(VOICE, voice='no-such-voice')) is None
+    assert library.synthesize("Hello.", VOICE)
+
+
+def test_data_path_only_for_the_bundled_library(tmp_path):
+    # A system library keeps its own compiled-in data directory
+    assert _bundled_data_path(str(tmp_path / "libespeak-ng.so.1")) is None
+    if ESPEAKNG_LOADER_AVAILABLE:
+        import espeakng_loader
+        assert _bundled_data_path(espeakng_loader.get_library_path()) == espeakng_loader.get_data_path()
@@ -0,0 +1,67 @@
+"""
+Tests for the interactive mode pipeline threads and commands
+"""
+
+import queue
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import main
+
+
+class FlakyEngine:
+    """Engine stand-in whose first synthesis and first playback fail."""
+
+    def __init__(self):
+        self.played = []
+        self.fail_synthesis = True
+        self.fail_playback = True
+
+    def synthesize_streaming(self, text, sink=None, voice_params=None):
+        if self.fail_synthesis:
+            self.fail_synthesis = False
+            raise RuntimeError("synthesis failed")
+        sink(text.encode())
+        return True
+
+    def play_audio(self, audio_data):
+        if self.fail_playback:
+            self.fail_playback = False
+            raise RuntimeError("device lost")
+        self.played.append(audio_data)
+        return True
+
+
+def join_with_timeout(q, timeout=5.0):
+    waiter = threading.Thread(target=q.join, daemon=True)
+    waiter.start()
+    waiter.join(timeout)
+    return not waiter.is_alive()
+
+
+def test_pipeline_threads_survive_errors():
+    engine = FlakyEngine()
+    pool = queue.Queue()
+    player_queue = queue.Queue()
+    threading.Thread(target=main._synthesis_loop, args=(engine, pool, player_queue), daemon=True).start()
+    threading.Thread(target=main._playback_loop, args=(engine, player_queue), daemon=True).start()
+
+    for text in ("first", "second", "third"):
+        pool.put((text, {}))
+
+    assert join_with_timeout(pool)
+    assert join_with_timeout(player_queue)
+    # "first" failed to synthesize and "second" failed to play
+    assert engine.played == [b'third']
+
+
+def test_quit_waits_for_pending_lines():
+    waited = []
+    with pytest.raises(SystemExit):
+        main.handle_interactive_command('!quit', None, None, lambda: waited.append(True))
+    assert waited == [True]
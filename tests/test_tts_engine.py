@@ -0,0 +1,51 @@
+"""
+Tests for sentence-streamed synthesis
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config_manager import ConfigManager
+from src.espeak_library import find_library
+
+if find_library() is None:
+    pytest.skip("libespeak-ng not available", allow_module_level=True)
+
+from src.tts_engine import TTSEngine
+from src.voice_manager import VoiceManager
+
+
+@pytest.fixture
+def engine(tmp_path):
+    config = ConfigManager()
+    config.set('paths', 'cache_directory', str(tmp_path / "cache"))
+    return TTSEngine(config, VoiceManager(config))
+
+
+def test_streaming_hands_each_sentence_to_sink(engine):
+    received = []
+    assert engine.synthesize_streaming("One. Two! Three?", sink=received.append)
+    assert len(received) == 3
+    assert all(audio_data[:4] == b'RIFF' for audio_data in received)
+
+
+def test_failing_sink_does_not_leak_the_producer(engine, monkeypatch):
+    monkeypatch.setattr(engine, '_synthesize_with_params', lambda text, params: b'audio')
+
+    def sink(audio_data):
+        raise RuntimeError("device lost")
+
+    before = set(threading.enumerate())
+    with pytest.raises(RuntimeError):
+        engine.synthesize_streaming(". ".join(["Sentence"] * 20) + ".", sink=sink)
+
+    deadline = time.monotonic() + 5
+    while set(threading.enumerate()) - before:
+        assert time.monotonic() < deadline, "producer thread still running"
+        time.sleep(0.01)
@@ -0,0 +1,59 @@
+"""
+Tests for the batched file writer used by batch mode
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils import TimedBuffer
+
+
+def test_timed_buffer_writes_everything_on_close(tmp_path):
+    writer = TimedBuffer(flush_bytes=1 << 20, flush_interval=60.0)
+    paths = [str(tmp_path / f"line_{i:03d}.wav") for i in range(5)]
+    for i, path in enumerate(paths):
+        writer.write(path, bytes([i]) * 100)
+
+    results = writer.close()
+    assert results == {path: True for path in paths}
+    for i, path in enumerate(paths):
+        assert Path(path).read_bytes() == bytes([i]) * 100
+
+
+def test_timed_buffer_flushes_on_size_and_interval(tmp_path):
+    writer = TimedBuffer(flush_bytes=64, flush_interval=0.01)
+    # Far more data than the back-pressure limit, so writes must be drained
+    # while the producer is still going
+    for i in range(50):
+        writer.write(str(tmp_path / f"{i}.bin"), b'x' * 100)
+
+    results = writer.close()
+    assert len(results) == 50
+    assert all(results.values())
+
+
+def test_timed_buffer_records_failed_writes(tmp_path):
+    writer = TimedBuffer()
+    good = str(tmp_path / "good.wav")
+    bad = str(tmp_path / "missing" / "bad.wav")
+    writer.write(good, b'data')
+    writer.write(bad, b'data')
+
+    assert writer.close() == {good: True, bad: False}
+
+
+def test_timed_buffer_survives_unexpected_errors(tmp_path):
+    writer = TimedBuffer(flush_bytes=64, flush_interval=0.01)
+    bad = str(tmp_path / "bad.wav")
+    # Not bytes, so the write itself raises TypeError
+    writer.write(bad, 'text')
+
+    paths = [str(tmp_path / f"{i}.bin") for i in range(20)]
+    for path in paths:
+        writer.write(path, b'x' * 100)
+
+    results = writer.close()
+    assert results[bad] is False
+    assert all(results[path] for path in paths)
@@ -0,0 +1,132 @@
+"""
+Tests for voice preset loading, deferred user presets and categories
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import src.voice_manager as voice_manager_module
+from src.config_manager import ConfigManager
+from src.voice_manager import VoiceManager
+
+
+@pytest.fixture
+def user_presets(tmp_path):
+    """Point the user presets file into tmp_path."""
+    return tmp_path / "voices.json"
+
+
+@pytest.fixture
+def config(user_presets, tmp_path):
+    config = ConfigManager()
+    config.set('paths', 'user_presets', str(user_presets))
+    config.set('paths', 'cache_directory', str(tmp_path / "cache"))
+    return config
+
+
+def write_presets(path, voices, categories=None):
+    data = {'voices': voices}
+    if categories is not None:
+        data['voice_categories'] = categories
+    path.write_text(json.dumps(data))
+
+
+def test_bundled_presets_load(config):
+    manager = VoiceManager(config)
+    assert 'classic_robot' in manager.list_voices()
+    assert manager.get_voice_info('classic_robot')['source'] == 'default'
+    assert manager.get_current_voice()['id'] == 'classic_robot'
+
+
+def test_user_presets_load_on_first_use(config, user_presets):
+    write_presets(user_presets, {'u1': {'name': 'U1'}, 'u2': {'name': 'U2'}}, {'retro': ['u1']})
+    manager = VoiceManager(config)
+    # A bundled startup voice does not touch the user file
+    assert not manager._user_loaded
+
+    assert 'u2' in manager.list_voices()
+    assert manager.get_voice_info('u2')['source'] == 'user'
+    assert manager.get_voice_categories()['retro'].count('u1') == 1
+
+
+def test_user_voice_selected_at_startup(config, user_presets):
+    write_presets(user_presets, {'u1': {'name': 'U1', 'speed': 210}})
+    config.set('synthesis', 'voice', 'u1')
+    manager = VoiceManager(config)
+    assert manager.get_current_voice()['id'] == 'u1'
+    assert manager.get_espeak_parameters()['speed'] == 210
+
+
+def test_user_preset_override_of_bundled_voice(config, user_presets):
+    write_presets(user_presets, {'classic_robot': {'name': 'Mine now', 'speed': 200}})
+    manager = VoiceManager(config)
+    assert not manager._user_loaded
+    # The override applies to the current voice once its parameters are used
+    assert manager.get_espeak_parameters()['speed'] == 200
+    assert manager.get_voice_info('classic_robot')['source'] == 'user'
+    assert manager.get_espeak_parameters()['speed'] == 200
+
+    # Deleting the override brings the bundled voice back
+    assert manager.delete_voice('classic_robot')
+    assert manager.get_voice_info('classic_robot')['source'] == 'default'
+
+
+def test_custom_voices_survive_user_load_and_save(config, user_presets):
+    write_presets(user_presets, {'u1': {'name': 'U1'}})
+    manager = VoiceManager(config)
+    assert manager.create_custom_voice('mine', 'Mine', speed=150)
+    assert manager.clone_voice('mine', 'mine2', 'Mine 2')
+    assert manager.get_voice_categories()['custom'] == ['mine', 'mine2']
+    assert manager.get_voice_info('mine')['source'] == 'custom'
+    assert manager.get_voice('u1') is not None
+
+    manager.save_user_presets()
+    saved = json.loads(user_presets.read_text())['voices']
+    assert sorted(saved) == ['mine', 'mine2', 'u1']
+
+    reloaded = VoiceManager(config)
+    assert reloaded.get_voice_info('mine')['source'] == 'user'
+    assert reloaded.get_voice('mine')['speed'] == 150
+
+
+def test_default_voices_cannot_be_deleted(config):
+    manager = VoiceManager(config)
+    assert not manager.delete_voice('classic_robot')
+    assert 'classic_robot' in manager.list_voices()
+
+
+def test_fallback_presets_when_bundled_file_missing(config, tmp_path):
+    config.set('paths', 'voice_presets', str(tmp_path / "missing.json"))
+    manager = VoiceManager(config)
+    assert manager.list_voices() == ['classic_robot']
+    assert manager.get_voice_info('classic_robot')['source'] == 'fallback'
+
+
+def test_custom_voice_without_base_gets_its_own_effects(config):
+    manager = VoiceManager(config)
+    assert manager.create_custom_voice('c1', 'C1')
+    assert manager.create_custom_voice('c2', 'C2', speed=200)
+
+    effects = manager.get_voice('c1')['effects']
+    assert effects is not voice_manager_module._FALLBACK_BASE['effects']
+    effects['frequency_filter'] = False
+    assert manager.get_voice('c2')['effects']['frequency_filter'] is True
+    assert voice_manager_module._FALLBACK_BASE['effects']['frequency_filter'] is True
+
+
+@pytest.mark.parametrize("parameters, valid", [
+    ({'speed': 150, 'pitch': 50, 'variant': 'f1', 'extra': object()}, True),
+    ({'speed': 301}, False),
+    ({'pitch': None}, False),
+    ({'espeak_voice': ''}, False),
+    ({'gap': 100, 'amplitude': 201}, False),
+])
+def test_create_custom_voice_validates_parameters(config, parameters, valid):
+    manager = VoiceManager(config)
+    assert manager.create_custom_voice('c1', 'C1', **parameters) is valid
+    assert (manager.get_voice('c1') is not None) is valid